@@ -6,6 +6,10 @@
 #              Don't modify the contents of this file.
 
 
+# Better distributed hash functions (see hashing.py for their speed)
+from hashing import builtin_hash, crc_hash, fnv1a_hash, keyed_hash, xxhash64
+
+
 # -------------- Used by both HashMaps (SC & OA)  -------------- #
 
 class DynamicArrayException(Exception):
@@ -78,6 +82,16 @@ class DynamicArray:
         return len(self._data)
 
 
+def as_list(values) -> list:
+    """
+    Return the elements of a DynamicArray (which can't be iterated) or of
+    any other iterable as a list, e.g. for the bulk HashMap methods.
+    """
+    if isinstance(values, DynamicArray):
+        return [values[index] for index in range(values.length())]
+    return list(values)
+
+
 def hash_function_1(key: str) -> int:
     """Sample Hash function #1 to be used with HashMap implementation"""
     hash = 0
@@ -103,12 +117,16 @@ class SLNode:
     Singly Linked List node for use in a hash map
     """
 
-    def __init__(self, key: str, value: object, next: "SLNode" = None) -> None:
-        """Initialize node given a key and value."""
+    def __init__(self, key: str, value: object, next: "SLNode" = None,
+                 hash: int = None) -> None:
+        """Initialize node given a key, value and (optionally) the key's hash."""
         self.key = key
         self.value = value
         self.next = next
 
+        # Full hash of key, cached so resizes and lookups don't recompute it
+        self.hash = hash
+
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
         return '(' + str(self.key) + ': ' + str(self.value) + ')'
@@ -141,7 +159,7 @@ class LinkedListIterator:
 class LinkedList:
     """
     Class implementing a Singly Linked List
-    Supported methods are: insert, remove, contains, length, iterator
+    Supported methods are: insert, put, remove, contains, length, iterator
     """
 
     def __init__(self) -> None:
@@ -168,20 +186,50 @@ class LinkedList:
         """Return an iterator for the list, starting at the head."""
         return LinkedListIterator(self._head)
 
-    def insert(self, key: str, value: object) -> None:
-        """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+    def insert(self, key: str, value: object, hash: int = None) -> None:
+        """Insert new node (caching the key's hash) at front of the list."""
+        self._head = SLNode(key, value, self._head, hash)
+        self._size += 1
+
+    def insert_node(self, node: SLNode) -> None:
+        """Insert an existing node (e.g. moved from another list) at front of the list."""
+        node.next = self._head
+        self._head = node
         self._size += 1
 
-    def remove(self, key: str) -> bool:
+    def take_nodes(self) -> SLNode:
+        """Empty the list and return its former head (the nodes stay linked)."""
+        head = self._head
+        self._head = None
+        self._size = 0
+        return head
+
+    def put(self, key: str, value: object, hash: int = None,
+            move_to_front: bool = False) -> bool:
+        """
+        Update the value of the node with matching key, or insert a new
+        node at front of the list, in a single walk.
+        With move_to_front, an updated node is moved to the front.
+        Return True if a node was inserted, False if one was updated.
+        """
+        node = self.contains(key, hash, move_to_front)
+        if node:
+            node.value = value
+            return False
+
+        self.insert(key, value, hash)
+        return True
+
+    def remove(self, key: str, hash: int = None) -> bool:
         """
         Remove first node with matching key.
+        If hash is given, only nodes with the same cached hash compare keys.
         Return True if removal was successful, False otherwise.
         """
         previous, node = None, self._head
         while node:
 
-            if node.key == key:
+            if (hash is None or node.hash == hash) and node.key == key:
                 if previous:
                     previous.next = node.next
                 else:
@@ -192,13 +240,23 @@ class LinkedList:
             previous, node = node, node.next
         return False
 
-    def contains(self, key: str) -> SLNode:
-        """Return node with matching key, or None if no match"""
-        node = self._head
+    def contains(self, key: str, hash: int = None,
+                 move_to_front: bool = False) -> SLNode:
+        """
+        Return node with matching key, or None if no match.
+        If hash is given, only nodes with the same cached hash compare keys.
+        With move_to_front, a matching node is moved to the front, so
+        frequently used keys are found first.
+        """
+        previous, node = None, self._head
         while node:
-            if node.key == key:
+            if (hash is None or node.hash == hash) and node.key == key:
+                if move_to_front and previous:
+                    previous.next = node.next
+                    node.next = self._head
+                    self._head = node
                 return node
-            node = node.next
+            previous, node = node, node.next
         return node
 
     def length(self) -> int:
@@ -210,11 +268,14 @@ class LinkedList:
 
 class HashEntry:
 
-    def __init__(self, key: str, value: object) -> None:
-        """Initialize an entry for use in a hash map."""
+    def __init__(self, key: str, value: object, hash: int = None) -> None:
+        """Initialize an entry (optionally caching the key's hash) for use in a hash map."""
         self.key = key
         self.value = value
 
+        # Full hash of key, cached so resizes and probes don't recompute it
+        self.hash = hash
+
         # Set this value to True when you "delete" a HashEntry
         self.is_tombstone = False
 
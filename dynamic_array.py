@@ -6,8 +6,35 @@
 # Description: Creation of several methods for the class DynamicArray.
 
 
+import functools
+import itertools
+import math
+import operator
+from array import array
+
+from growth_policy import DEFAULT_POLICY, FactorPolicy, GrowthPolicy, PagePolicy
 from static_array import StaticArray
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Reducers which fold a whole typed buffer at C speed instead of calling
+# a Python function per element: reduce_func -> bulk(values, start).
+# Each gives the same result as the left fold (start first, then every
+# value in order): min/max keep the fold order so NaN compares the same,
+# and floats aren't summed with sum(), which compensates rounding from
+# Python 3.12 on
+_BULK_REDUCERS = {
+    operator.add: lambda values, start: (functools.reduce(operator.add, values, start)
+                                         if values.format in 'fd' else sum(values, start)),
+    operator.mul: lambda values, start: math.prod(values, start=start),
+    min: lambda values, start: min(itertools.chain((start,), values)),
+    max: lambda values, start: max(itertools.chain((start,), values)),
+}
+
 
 class DynamicArrayException(Exception):
     """
@@ -18,14 +45,22 @@ class DynamicArrayException(Exception):
 
 
 class DynamicArray:
-    def __init__(self, start_array=None):
+    def __init__(self, start_array=None, typecode: str = None,
+                 policy: GrowthPolicy = None):
         """
         Initialize new dynamic array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        An optional typecode stores the elements in a typed StaticArray
+        An optional growth policy replaces the default doubling/quartering
         """
         self._size = 0
         self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._typecode = typecode
+        self._data = StaticArray(self._capacity, typecode)
+        self._policy = policy if policy is not None else DEFAULT_POLICY
+
+        # number of resizes and of elements copied by them
+        self._resizes = 0
+        self._copies = 0
 
         # populate dynamic array with initial values (if provided)
         # before using this feature, implement append() method
@@ -121,6 +156,102 @@ class DynamicArray:
         """
         return self._capacity
 
+    def get_typecode(self) -> str:
+        """
+        Return the typecode of the underlying StaticArray (None if untyped)
+        """
+        return self._typecode
+
+    def get_resize_stats(self) -> tuple[int, int]:
+        """
+        Return the number of resizes and the number of element copies
+        they caused since the array was created
+        """
+        return self._resizes, self._copies
+
+    def get_memoryview(self) -> memoryview:
+        """
+        Return a zero-copy memoryview over the elements of a typed array
+        The view shares the live storage, so it is only valid until the
+        next resize; untyped arrays raise DynamicArrayException
+        """
+        if self._typecode is None:
+            raise DynamicArrayException('Only typed arrays export a buffer')
+        return self._data.get_memoryview()[:self._size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Enable memoryview(da) and the buffer protocol (Python 3.12+)
+        """
+        return self.get_memoryview()
+
+    def _as_ndarray(self, func) -> object:
+        """
+        Return the elements as a zero-copy NumPy array when func can be
+        evaluated over the whole buffer at once (typed array, NumPy
+        installed and func is a ufunc), otherwise None
+        """
+        if (numpy is None or self._typecode is None
+                or not isinstance(func, numpy.ufunc)):
+            return None
+        return numpy.frombuffer(self.get_memoryview(), dtype=self._typecode)
+
+    @staticmethod
+    def _widened(values) -> object:
+        """
+        Helper method which converts a NumPy array of any numeric typecode
+        to int64 or float64, the types NumPy gives a single Python int or
+        float, so a ufunc over the array matches a ufunc called per element
+
+        :param values: a NumPy array or None
+
+        :return: a NumPy array, or None if values is None or holds unsigned
+                 values too large for int64
+        """
+        if values is None:
+            return None
+        if values.dtype.kind == 'f':
+            return values.astype(numpy.float64)
+        if values.dtype.kind == 'u' and len(values) and values.max() > numpy.iinfo(numpy.int64).max:
+            return None
+        return values.astype(numpy.int64)
+
+    @staticmethod
+    def _fits(value, dtype) -> bool:
+        """
+        Helper method which checks that a Python number keeps its value
+        and type when stored in a NumPy dtype (e.g. as a reduce initializer)
+
+        :param value: any Python object
+        :param dtype: a NumPy dtype
+
+        :return: a Boolean
+        """
+        try:
+            stored = numpy.array(value, dtype=dtype).item()
+        except (OverflowError, TypeError, ValueError):
+            return False
+        return type(stored) is type(value) and stored == value
+
+    def _load_block(self, values, typecode: str = None) -> "DynamicArray":
+        """
+        Helper method which builds a new DynamicArray (with the growth
+        policy of this one) from a sized sequence, allocating the exact
+        capacity once
+
+        :param values: a sized sequence (list or array.array)
+        :param typecode: typecode of the new array
+
+        :return: a DynamicArray object
+        """
+        output_arr = DynamicArray(typecode=typecode, policy=self._policy)
+        count = len(values)
+        if count > output_arr._capacity:
+            output_arr.resize(count)
+        output_arr._data.set_range(0, values)
+        output_arr._size = count
+        return output_arr
+
     def print_da_variables(self) -> None:
         """
         Print information contained in the dynamic array.
@@ -144,13 +275,38 @@ class DynamicArray:
         if new_capacity <= 0 or new_capacity < self._size:
             return
 
-        new_arr = StaticArray(new_capacity)
+        new_arr = StaticArray(new_capacity, self._typecode)
 
-        for pos in range(self._size):
-            new_arr[pos] = self._data[pos]
+        # Copies all elements to the new array as one block
+        new_arr.copy_range(self._data, 0, 0, self._size)
 
         self._data = new_arr
         self._capacity = new_capacity
+        self._resizes += 1
+        self._copies += self._size
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grows the array so it holds at least capacity elements without
+        any further resize
+
+        :param capacity: integer
+
+        :return: does not return
+        """
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrinks the capacity down to the number of elements stored
+
+        :param: a DynamicArray instance
+
+        :return: does not return
+        """
+        if self._capacity > max(self._size, 1):
+            self.resize(max(self._size, 1))
 
     def append(self, value: object) -> None:
         """
@@ -162,7 +318,7 @@ class DynamicArray:
         """
         # Checks size and capacity and appends value at the end of array (resized or not)
         if self._size == self._capacity:
-            self.resize(2 * self._capacity)
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
 
         self._data[self._size] = value
         self._size += 1
@@ -182,11 +338,10 @@ class DynamicArray:
 
         # Checks if current array needs to be resized
         if self._size == self._capacity:
-            self.resize(self._capacity*2)
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
 
-        # Moves elements down the array to insert the new one
-        for pos in range(self._size, index, -1):
-            self._data[pos] = self._data[pos-1]
+        # Moves elements down the array (as one block) to insert the new one
+        self._data.move_range(index, index + 1, self._size - index)
 
         # Inserts the new element in the array
         self._data[index] = value
@@ -204,14 +359,13 @@ class DynamicArray:
         if index < 0 or index >= self._size:
             raise DynamicArrayException("Invalid index.")
 
-        # Checks if current array needs to be resized
-        if self._capacity > 10 and self._size < (self._capacity / 4):
-            new_cap = max(self._size * 2, 10)
+        # Checks if current array needs to be resized (shrunk) by the policy
+        new_cap = self._policy.shrink(self._size, self._capacity)
+        if new_cap != self._capacity:
             self.resize(new_cap)
 
-        # Moves elements up the array removing the element at the index
-        for pos in range(index + 1, self._size):
-            self._data[pos-1] = self._data[pos]
+        # Moves elements up the array (as one block) removing the element at the index
+        self._data.move_range(index + 1, index, self._size - index - 1)
 
         # Turns the last element to 0
         self._data[self._size-1] = 0
@@ -232,7 +386,7 @@ class DynamicArray:
                 or (size < 0)):
             raise DynamicArrayException
 
-        output_arr = DynamicArray()
+        output_arr = DynamicArray(typecode=self._typecode, policy=self._policy)
 
         # Slices the current array and creates a subset into a new array
         for pos in range(start_index, start_index + size):
@@ -260,8 +414,19 @@ class DynamicArray:
 
         :return: a DynamicArray object
         """
-        # Creates a new DynamicArray object (new array)
-        output_arr = DynamicArray()
+        # Vectorized path: applies a NumPy ufunc over the whole typed buffer,
+        # widened first to the 64-bit type each element would be converted
+        # to on its own, so results don't wrap in a narrow typecode
+        values = self._widened(self._as_ndarray(map_func))
+        if values is not None and map_func.nin == 1:
+            result = map_func(values)
+            if result.dtype.char in "bBhHiIlLqQfd":
+                return self._load_block(array(result.dtype.char, result.tobytes()),
+                                        result.dtype.char)
+            return self._load_block(result.tolist())
+
+        # Creates a new DynamicArray object (new array) with the same growth policy
+        output_arr = DynamicArray(policy=self._policy)
 
         # Passes each item of current array to function and append to new array
         for pos in range(self.length()):
@@ -277,8 +442,16 @@ class DynamicArray:
 
         :return: a DynamicArray object
         """
-        # Creates a new DynamicArray object (new array)
-        output_arr = DynamicArray()
+        # Vectorized path: a boolean NumPy ufunc selects items as one mask
+        values = self._as_ndarray(filter_func)
+        if values is not None and filter_func.nin == 1:
+            mask = filter_func(values)
+            if mask.dtype == bool:
+                return self._load_block(array(self._typecode, values[mask].tobytes()),
+                                        self._typecode)
+
+        # Creates a new DynamicArray object (new array) of the same type and policy
+        output_arr = DynamicArray(typecode=self._typecode, policy=self._policy)
 
         # Passes each item of current array to function and, if True, append item to new array
         for pos in range(self.length()):
@@ -299,6 +472,23 @@ class DynamicArray:
         :return: an integer or None
         """
 
+        # Vectorized paths for typed arrays with a known reducer or a NumPy ufunc
+        if self._typecode is not None and self._size > 0:
+            # Widened like map(), so the fold doesn't wrap in a narrow typecode
+            values = self._widened(self._as_ndarray(reduce_func))
+            if values is not None and reduce_func.nin == 2:
+                if initializer is None:
+                    return reduce_func.reduce(values).item()
+                if self._fits(initializer, values.dtype):
+                    return reduce_func.reduce(values, initial=initializer).item()
+
+            bulk = _BULK_REDUCERS.get(reduce_func)
+            if bulk is not None:
+                values = self.get_memoryview()
+                if initializer is None:
+                    return bulk(values[1:], values[0])
+                return bulk(values, initializer)
+
         # Checks conditions and apply reduce_func accordingly
         if initializer is None and self._size > 1:
             first_iter = reduce_func(self._data[0], self._data[1])
@@ -317,6 +507,17 @@ class DynamicArray:
                 first_iter = reduce_func(first_iter, self._data[pos])
             return first_iter
 
+    def lazy(self) -> "LazyDynamicArray":
+        """
+        Returns a lazy view of the current array on which map, filter and
+        slice calls are recorded instead of executed.
+
+        :param: a DynamicArray instance
+
+        :return: a LazyDynamicArray object
+        """
+        return LazyDynamicArray(self)
+
     def pop(self) -> None:
         """
         Removes the element at the end of the DynamicArray object
@@ -327,47 +528,164 @@ class DynamicArray:
 
         """
         last_item_index = self._size - 1
-        self._data[last_item_index] = None
+        self._data[last_item_index] = None if self._typecode is None else 0
         self._size -= 1
 
 
+class LazyDynamicArray:
+    """
+    Lazy view over a DynamicArray returned by DynamicArray.lazy()
+    map, filter and slice return new views; nothing is computed until
+    to_array() or reduce() is called, which run every stage fused in a
+    single pass and stop reading the source once all slices are satisfied
+    """
+
+    def __init__(self, source: DynamicArray, stages: tuple = ()) -> None:
+        """
+        Initialize a view over source with the given pipeline stages
+        """
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self):
+        """
+        Return a generator over the values produced by the pipeline
+        """
+        source = self._source
+        values = (source[pos] for pos in range(source.length()))
+
+        for kind, arg in self._stages:
+            if kind == 'map':
+                values = map(arg, values)
+            elif kind == 'filter':
+                values = filter(arg, values)
+            else:
+                values = self._sliced(values, *arg)
+
+        return values
+
+    @staticmethod
+    def _sliced(values, start_index: int, size: int):
+        """
+        Helper generator which yields size values after skipping
+        start_index values, raising DynamicArrayException (like
+        DynamicArray.slice) if the input has no value at start_index
+        or runs out before size values
+
+        :param values: an iterator
+        :param start_index: integer
+        :param size: integer
+        """
+        # Reads one value even for an empty slice, to check start_index
+        needed = max(size, 1)
+        taken = 0
+        for value in itertools.islice(values, start_index, start_index + needed):
+            taken += 1
+            if taken <= size:
+                yield value
+
+        if taken < needed:
+            raise DynamicArrayException
+
+    def _then(self, kind: str, arg) -> "LazyDynamicArray":
+        """
+        Helper method which returns a new view with one more stage
+        """
+        return LazyDynamicArray(self._source, self._stages + ((kind, arg),))
+
+    def map(self, map_func) -> "LazyDynamicArray":
+        """
+        Records a map stage.
+
+        :param map_func: a function
+
+        :return: a LazyDynamicArray object
+        """
+        return self._then('map', map_func)
+
+    def filter(self, filter_func) -> "LazyDynamicArray":
+        """
+        Records a filter stage.
+
+        :param filter_func: a function
+
+        :return: a LazyDynamicArray object
+        """
+        return self._then('filter', filter_func)
+
+    def slice(self, start_index: int, size: int) -> "LazyDynamicArray":
+        """
+        Records a slice stage, with the same rules as DynamicArray.slice().
+        Indices outside the source raise DynamicArrayException right away;
+        running out of values after filtering raises it when the view is
+        evaluated.
+
+        :param start_index: integer
+        :param size: integer
+
+        :return: a LazyDynamicArray object
+        """
+        length = self._source.length()
+        if (start_index < 0 or start_index >= length
+                or size > length - start_index or size < 0):
+            raise DynamicArrayException
+        return self._then('slice', (start_index, size))
+
+    def to_array(self) -> DynamicArray:
+        """
+        Runs the pipeline and stores its values in a new DynamicArray
+        with the source's growth policy. The source typecode is kept
+        unless the pipeline has a map stage.
+
+        :param: a LazyDynamicArray object
+
+        :return: a DynamicArray object
+        """
+        typecode = self._source.get_typecode()
+        if any(kind == 'map' for kind, _ in self._stages):
+            typecode = None
+
+        output_arr = DynamicArray(typecode=typecode, policy=self._source._policy)
+        for value in self:
+            output_arr.append(value)
+
+        return output_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Runs the pipeline folding its values with reduce_func, with the
+        same rules as DynamicArray.reduce().
+
+        :param reduce_func: a function
+        :param initializer: an integer
+
+        :return: an integer or None
+        """
+        values = iter(self)
+
+        result = initializer
+        if initializer is None:
+            result = next(values, None)
+
+        for value in values:
+            result = reduce_func(result, value)
+
+        return result
+
+
 def find_mode(arr: DynamicArray) -> tuple[DynamicArray, int]:
     """
     Determines the mode or modes for and its frequency from a DynamicArray object.
+    The input does not need to be sorted; modes are returned in first-seen order.
 
     :param arr: DynamicArray object
 
     :return: a tuple with a DynamicArray object and an integer
     """
+    # Imported here because frequency itself depends on this module
+    from frequency import FrequencyCounter
 
-    count = 1
-    num = arr[0]
-    max = 1                                     # frequency of the mode or modes
-    mode = DynamicArray()                       # mode array created to deal with count = max for first 2 items
-
-    # Checks for the mode and frequency of items
-    for index in range(1, arr.length()):
-        if arr[index] == num:
-            count += 1
-        else:
-            if count > max:
-                max = count
-                mode = DynamicArray()            # created to overwrite previous mode in the mode array if count > max
-                mode.append(num)
-            elif count == max:
-                mode.append(num)                 # if count = max, then appends the num to current mode array
-            num = arr[index]
-            count = 1
-
-    # Checks for the last item in the array
-    if count > max:
-        max = count
-        mode = DynamicArray()                    # created to overwrite previous mode in the mode array if count > max
-        mode.append(num)
-    elif count == max:
-        mode.append(num)                         # if count = max, then appends the num to current mode array
-
-    return mode, max
+    return FrequencyCounter(arr).mode()
 
 
 # ------------------- BASIC TESTING -----------------------------------------
@@ -395,6 +713,19 @@ if __name__ == "__main__":
     da.resize(8)
     print(da)
 
+    print("\n# resize - example 3")
+    da = DynamicArray([1, 2, 3, 4, 5], typecode='q')
+    da.print_da_variables()
+    da.resize(10)
+    da.print_da_variables()
+
+    print("\n# get_memoryview - example 1")
+    da = DynamicArray([1, 2, 3, 4, 5], typecode='q')
+    view = da.get_memoryview()
+    print(view.tolist(), view.format, view.nbytes)
+    view[4] = 50
+    print(da)
+
     print("\n# append - example 1")
     da = DynamicArray()
     da.print_da_variables()
@@ -415,6 +746,19 @@ if __name__ == "__main__":
     print(da.length())
     print(da.get_capacity())
 
+    print("\n# append - example 4 (growth policies)")
+    for policy in [DEFAULT_POLICY, FactorPolicy(1.5), PagePolicy(256)]:
+        da = DynamicArray(policy=policy)
+        for i in range(10000):
+            da.append(i)
+        for i in range(9000):
+            da.remove_at_index(da.length() - 1)
+        print(type(policy).__name__, da.length(), da.get_capacity(), da.get_resize_stats())
+    da.shrink_to_fit()
+    print(da.length(), da.get_capacity())
+    da.reserve(5000)
+    print(da.length(), da.get_capacity())
+
     print("\n# insert_at_index - example 1")
     da = DynamicArray([100])
     print(da)
@@ -564,6 +908,12 @@ if __name__ == "__main__":
     for value in [1, 10, 20]:
         print(da.map(lambda x: x(value)))
 
+    print("\n# map example 3 (typed array)")
+    da = DynamicArray([200, 3, 255], typecode='B')
+    print(da.map(square))
+    if numpy is not None:
+        print(da.map(numpy.square))
+
     print("\n# filter example 1")
 
 
@@ -604,6 +954,28 @@ if __name__ == "__main__":
     print(da.reduce(lambda x, y: x + y ** 2))
     print(da.reduce(lambda x, y: x + y ** 2, -1))
 
+    print("\n# reduce example 3 (typed array)")
+    da = DynamicArray([100, 5, 10, 15, 20, 25], typecode='q')
+    print(da.reduce(operator.add), da.reduce(operator.add, -1))
+    print(da.reduce(max), da.reduce(min, 1), da.reduce(operator.mul))
+
+    print("\n# reduce example 4 (narrow typed array)")
+    da = DynamicArray([2 ** 31 - 1, -5], typecode='i')
+    print(da.reduce(lambda x, y: x - y), da.reduce(max, -1))
+    if numpy is not None:
+        print(da.reduce(numpy.subtract), da.reduce(numpy.maximum, -1))
+    print(DynamicArray([1.5, float('nan'), 2.0], typecode='d').reduce(max))
+
+    print("\n# lazy example 1")
+    da = DynamicArray(range(100000))
+    view = da.lazy().map(lambda x: x * 3).filter(lambda x: x % 7 == 0).slice(2, 4)
+    print(view.to_array())
+    print(view.reduce(lambda x, y: x + y))
+    try:
+        da.lazy().filter(lambda x: x < 3).slice(0, 5).to_array()
+    except Exception as e:
+        print("Exception raised:", type(e))
+
     print("\n# find_mode - example 1")
     test_cases = (
         [1, 1, 2, 3, 3, 4],
@@ -0,0 +1,346 @@
+# Course: CS261 - Data Structures
+# Description: Frequency counting for DynamicArray objects. Counts unsorted
+#              input in a single pass, finds the mode(s), the top k most
+#              frequent values, and merges partial counts of separate chunks,
+#              which can be counted in parallel over a process pool.
+
+
+import mmap
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from dynamic_array import DynamicArray
+from min_heap import MinHeap
+
+
+class FrequencyCounter:
+    """
+    Counts how many times each value occurs in one or more DynamicArrays.
+    Values must be hashable; they are never compared with each other, so
+    mixed types are allowed.
+    Supported methods are: update, add, merge, count, length, mode, top_k
+    """
+
+    def __init__(self, start_array=None) -> None:
+        """
+        Initialize a new counter, counting start_array if provided
+        """
+        # Compact counting table: value -> count, in first-seen order
+        self._counts = Counter()
+
+        if start_array is not None:
+            self.update(start_array)
+
+    def __str__(self) -> str:
+        """
+        Return content of the counter in human-readable form
+        """
+        pairs = [f"{value}: {count}" for value, count in self._counts.items()]
+        return "FREQ {" + ", ".join(pairs) + "}"
+
+    def update(self, da: DynamicArray) -> None:
+        """
+        Counts every value of a DynamicArray object in one pass.
+        Any array with length() and [] indexing (e.g. a6_include.DynamicArray)
+        is accepted as well.
+
+        :param da: DynamicArray object
+
+        :return: does not return
+        """
+        # Typed arrays are read straight from their buffer
+        if getattr(da, "get_typecode", lambda: None)() is not None:
+            self._counts.update(da.get_memoryview())
+        else:
+            self._counts.update(da[index] for index in range(da.length()))
+
+    def add(self, value: object, count: int = 1) -> None:
+        """
+        Adds count occurrences of a single value.
+
+        :param value: any hashable Python object
+        :param count: an integer
+
+        :return: does not return
+        """
+        self._counts[value] += count
+
+    def merge(self, other: "FrequencyCounter") -> None:
+        """
+        Adds the counts of another counter (e.g. of a separate chunk) to this one.
+
+        :param other: a FrequencyCounter object
+
+        :return: does not return
+        """
+        self._counts.update(other._counts)
+
+    def count(self, value: object) -> int:
+        """
+        Returns how many times a value was counted.
+
+        :param value: any hashable Python object
+
+        :return: an integer
+        """
+        return self._counts.get(value, 0)
+
+    def length(self) -> int:
+        """
+        Returns the number of distinct values counted.
+
+        :param: a FrequencyCounter object
+
+        :return: an integer
+        """
+        return len(self._counts)
+
+    def mode(self) -> tuple[DynamicArray, int]:
+        """
+        Determines the mode or modes (in first-seen order) and their frequency.
+
+        :param: a FrequencyCounter object
+
+        :return: a tuple with a DynamicArray object and an integer
+        """
+        mode = DynamicArray()
+        if not self._counts:
+            return mode, 0
+
+        max_count = 0
+        for value, count in self._counts.items():
+            if count > max_count:
+                max_count = count
+                mode = DynamicArray()
+            if count == max_count:
+                mode.append(value)
+
+        return mode, max_count
+
+    def top_k(self, k: int) -> DynamicArray:
+        """
+        Finds the k most frequent values using a MinHeap bounded to k items.
+        Ties are broken by first-seen order.
+
+        :param k: an integer
+
+        :return: DynamicArray of (value, count) tuples, most frequent first
+        """
+        if k <= 0:
+            return DynamicArray()
+
+        # Heap items are (count, -order, value); order is unique, so values
+        # themselves are never compared
+        heap = MinHeap()
+        for order, (value, count) in enumerate(self._counts.items()):
+            item = (count, -order, value)
+            if heap.size() < k:
+                heap.add(item)
+            elif item > heap.get_min():
+                heap.remove_min()
+                heap.add(item)
+
+        # Removing from a min heap yields the least frequent first
+        size = heap.size()
+        result = DynamicArray([None] * size)
+        for index in range(size - 1, -1, -1):
+            count, _, value = heap.remove_min()
+            result[index] = (value, count)
+
+        return result
+
+
+def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
+    """
+    Determines the mode or modes and their frequency from an unsorted
+    DynamicArray object.
+
+    :param da: DynamicArray object
+
+    :return: a tuple with a DynamicArray object and an integer
+    """
+    return FrequencyCounter(da).mode()
+
+
+def _chunk_bounds(length: int, chunks: int) -> list:
+    """
+    Helper function which splits range(length) into at most chunks
+    contiguous (start, stop) pairs of nearly equal size
+    """
+    chunks = max(1, min(chunks, length))
+    step, extra = divmod(length, chunks)
+    bounds, start = [], 0
+    for index in range(chunks):
+        stop = start + step + (1 if index < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _count_shared(name: str, typecode: str, start: int, stop: int) -> dict:
+    """
+    Worker function: counts elements [start, stop) of a typed buffer held
+    in the shared memory block called name, without copying it
+    """
+    shm = SharedMemory(name=name)
+    view = None
+    try:
+        view = shm.buf.cast(typecode)
+        counts = Counter(view[start:stop])
+    finally:
+        # Releases the view first, otherwise close() raises BufferError
+        if view is not None:
+            view.release()
+        shm.close()
+    return counts
+
+
+def _count_file(path: str, typecode: str, start: int, stop: int) -> dict:
+    """
+    Worker function: counts elements [start, stop) of a file of raw typed
+    values by memory-mapping it (a trailing partial value is left out)
+    """
+    itemsize = array(typecode).itemsize
+    with open(path, "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as raw, \
+            raw[:len(raw) // itemsize * itemsize] as trimmed, \
+            trimmed.cast(typecode) as view:
+        counts = Counter(view[start:stop])
+    return counts
+
+
+def _reduce_partials(partials) -> FrequencyCounter:
+    """
+    Helper function which merges partial counts (in chunk order, so
+    first-seen order is kept) into a single FrequencyCounter
+    """
+    counter = FrequencyCounter()
+    for partial in partials:
+        counter._counts.update(partial)
+    return counter
+
+
+def parallel_count(da: DynamicArray, workers: int = None,
+                   chunks: int = None) -> FrequencyCounter:
+    """
+    Counts a typed DynamicArray in chunks over a process pool. The buffer
+    is copied once into shared memory, which every worker reads in place,
+    so elements are never pickled. That copy costs one extra buffer's
+    worth of memory (length * itemsize bytes) and one memcpy, because a
+    DynamicArray's storage is ordinary process memory; data already in a
+    file can be counted without it by parallel_count_file. Untyped arrays
+    are counted in this process.
+
+    :param da: DynamicArray object
+    :param workers: number of worker processes (default: CPU count)
+    :param chunks: number of chunks (default: 4 per worker)
+
+    :return: a FrequencyCounter object
+    """
+    typecode = da.get_typecode()
+    if typecode is None or da.length() == 0:
+        return FrequencyCounter(da)
+
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(da.length(), chunks or workers * 4)
+
+    # The array's storage is private to this process, so workers read a
+    # copy of it (one extra buffer, alive until all chunks are counted)
+    source = da.get_memoryview().cast("B")
+    shm = SharedMemory(create=True, size=source.nbytes)
+    try:
+        shm.buf[:source.nbytes] = source
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = pool.map(_count_shared,
+                                [shm.name] * len(bounds), [typecode] * len(bounds),
+                                [start for start, _ in bounds],
+                                [stop for _, stop in bounds])
+            return _reduce_partials(partials)
+    finally:
+        source.release()
+        shm.close()
+        shm.unlink()
+
+
+def parallel_count_file(path: str, typecode: str, workers: int = None,
+                        chunks: int = None) -> FrequencyCounter:
+    """
+    Counts a file of raw typed values (e.g. written from a typed
+    DynamicArray's memoryview) in chunks over a process pool. Each worker
+    memory-maps the file and reads only its own chunk. Bytes after the
+    last whole value (e.g. in a truncated log) are ignored.
+
+    :param path: path of the file
+    :param typecode: array module typecode of the stored values
+    :param workers: number of worker processes (default: CPU count)
+    :param chunks: number of chunks (default: 4 per worker)
+
+    :return: a FrequencyCounter object
+    """
+    length = os.path.getsize(path) // array(typecode).itemsize
+    if length == 0:
+        return FrequencyCounter()
+
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(length, chunks or workers * 4)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(_count_file,
+                            [path] * len(bounds), [typecode] * len(bounds),
+                            [start for start, _ in bounds],
+                            [stop for _, stop in bounds])
+        return _reduce_partials(partials)
+
+
+def parallel_find_mode(da: DynamicArray, workers: int = None) -> tuple[DynamicArray, int]:
+    """
+    Determines the mode or modes and their frequency from a DynamicArray
+    object, counting typed arrays in parallel.
+
+    :param da: DynamicArray object
+    :param workers: number of worker processes (default: CPU count)
+
+    :return: a tuple with a DynamicArray object and an integer
+    """
+    return parallel_count(da, workers).mode()
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# find_mode - example 1")
+    test_cases = (
+        [1, 1, 2, 3, 3, 4],
+        [4, 3, 3, 2, 2, 2, 1, 1, 1, 1],
+        ["2", "4", "2", "6", "8", "4", "1", "3", "4", "5", "7", "3", "3", "2"],
+        []
+    )
+    for case in test_cases:
+        da = DynamicArray(case)
+        mode, frequency = find_mode(da)
+        print(f"{da}\nMode: {mode}, Frequency: {frequency}\n")
+
+    print("\n# top_k - example 1")
+    counter = FrequencyCounter(DynamicArray("the cat and the dog and the bird".split()))
+    print(counter)
+    for k in [0, 1, 2, 10]:
+        print(k, counter.top_k(k))
+
+    print("\n# merge - example 1")
+    first = FrequencyCounter(DynamicArray([1, 2, 2, 3], typecode='q'))
+    second = FrequencyCounter(DynamicArray([3, 3, 4], typecode='q'))
+    first.merge(second)
+    print(first, first.count(3), first.length())
+    mode, frequency = first.mode()
+    print(f"Mode: {mode}, Frequency: {frequency}")
+
+    print("\n# parallel_find_mode - example 1")
+    da = DynamicArray([value % 1000 for value in range(100000)] + [7], typecode='q')
+    mode, frequency = parallel_find_mode(da, workers=2)
+    print(f"Mode: {mode}, Frequency: {frequency}")
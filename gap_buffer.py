@@ -0,0 +1,470 @@
+# Course: CS261 - Data Structures
+# Description: GapBuffer, a variant of DynamicArray for workloads that
+#              insert and remove near a moving position (text editing,
+#              ordered logs). The free space of the array is kept as a gap
+#              at the last edit position, so edits next to the previous one
+#              only move the elements between the two positions.
+
+
+from dynamic_array import DynamicArrayException, LazyDynamicArray
+from growth_policy import DEFAULT_POLICY, GrowthPolicy
+from static_array import StaticArray
+
+
+class GapBuffer:
+    """
+    Gap buffer with the same methods as DynamicArray.
+    Elements [0, gap_start) and [gap_end, capacity) of the underlying
+    StaticArray hold the data; [gap_start, gap_end) is free space.
+    Invalid indices raise DynamicArrayException, like DynamicArray.
+    """
+
+    def __init__(self, start_array=None, typecode: str = None,
+                 policy: GrowthPolicy = None) -> None:
+        """
+        Initialize new gap buffer
+        An optional typecode stores the elements in a typed StaticArray
+        """
+        self._size = 0
+        self._capacity = 4
+        self._typecode = typecode
+        self._data = StaticArray(self._capacity, typecode)
+        self._policy = policy if policy is not None else DEFAULT_POLICY
+
+        # the gap initially covers the whole array
+        self._gap_start = 0
+        self._gap_end = self._capacity
+
+        # number of resizes and of elements copied by them
+        self._resizes = 0
+        self._copies = 0
+
+        if start_array is not None:
+            for value in start_array:
+                self.append(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of gap buffer in human-readable form
+        """
+        out = "GAP_BUF Size/Cap: "
+        out += str(self._size) + "/" + str(self._capacity) + ' ['
+        out += ', '.join([str(self[_]) for _ in range(self._size)])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Create iterator for loop
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Obtain next value and advance iterator
+        """
+        if self._index >= self._size:
+            raise StopIteration
+
+        value = self[self._index]
+        self._index += 1
+        return value
+
+    def _physical(self, index: int) -> int:
+        """
+        Helper method which maps a logical index onto the StaticArray,
+        skipping over the gap
+        """
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+
+    def _move_gap(self, index: int) -> None:
+        """
+        Helper method which moves the gap so it starts at logical index,
+        shifting only the elements between the old and new positions
+        """
+        if index < self._gap_start:
+            count = self._gap_start - index
+            self._data.move_range(index, self._gap_end - count, count)
+        elif index > self._gap_start:
+            count = index - self._gap_start
+            self._data.move_range(self._gap_end, self._gap_start, count)
+        else:
+            return
+
+        self._gap_end += index - self._gap_start
+        self._gap_start = index
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._data[self._physical(index)]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the buffer
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._data[self._physical(index)] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using array[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using array[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True is buffer is empty / False otherwise
+        """
+        return self._size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in buffer
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return the capacity of the buffer
+        """
+        return self._capacity
+
+    def get_typecode(self) -> str:
+        """
+        Return the typecode of the underlying StaticArray (None if untyped)
+        """
+        return self._typecode
+
+    def get_resize_stats(self) -> tuple[int, int]:
+        """
+        Return the number of resizes and the number of element copies
+        they caused since the buffer was created
+        """
+        return self._resizes, self._copies
+
+    def get_memoryview(self) -> memoryview:
+        """
+        Return a zero-copy memoryview over the elements of a typed buffer
+        The gap is first moved to the end so the elements are contiguous;
+        the view shares the live storage, so it is only valid until the
+        next edit or resize; untyped buffers raise DynamicArrayException
+        """
+        if self._typecode is None:
+            raise DynamicArrayException('Only typed buffers export a buffer')
+        self._move_gap(self._size)
+        return self._data.get_memoryview()[:self._size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Enable memoryview(gb) and the buffer protocol (Python 3.12+)
+        """
+        return self.get_memoryview()
+
+    def print_da_variables(self) -> None:
+        """
+        Print information contained in the gap buffer.
+        Used for testing purposes.
+        """
+        print(f"Length: {self._size}, Capacity: {self._capacity}, "
+              f"Gap: [{self._gap_start}, {self._gap_end}), {self._data}")
+
+    # -----------------------------------------------------------------------
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements into a new StaticArray of the given capacity,
+        keeping the gap at its current position
+
+        :param new_capacity: integer
+
+        :return: does not return
+        """
+        # Data validation for new capacity
+        if new_capacity <= 0 or new_capacity < self._size:
+            return
+
+        new_arr = StaticArray(new_capacity, self._typecode)
+        tail = self._capacity - self._gap_end
+
+        # Copies the elements before and after the gap as two blocks
+        new_arr.copy_range(self._data, 0, 0, self._gap_start)
+        new_arr.copy_range(self._data, self._gap_end, new_capacity - tail, tail)
+
+        self._data = new_arr
+        self._capacity = new_capacity
+        self._gap_end = new_capacity - tail
+        self._resizes += 1
+        self._copies += self._size
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grows the buffer so it holds at least capacity elements without
+        any further resize
+
+        :param capacity: integer
+
+        :return: does not return
+        """
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrinks the capacity down to the number of elements stored
+        (removing the gap)
+
+        :param: a GapBuffer instance
+
+        :return: does not return
+        """
+        if self._capacity > max(self._size, 1):
+            self.resize(max(self._size, 1))
+
+    def append(self, value: object) -> None:
+        """
+        Adds an element at the end of the GapBuffer object
+
+        :param value: any data type object
+
+        :return: does not return
+        """
+        self.insert_at_index(self._size, value)
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Inserts an element at a specific index; O(1) amortized when index
+        is next to the previous edit
+
+        :param index: integer
+        :param value: any data type object
+
+        :return: does not return
+        """
+        # Data validation
+        if index < 0 or index > self._size:
+            raise DynamicArrayException("Invalid index.")
+
+        # Checks if current buffer needs to be resized (the gap is empty)
+        if self._size == self._capacity:
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+
+        # Moves the gap to the index and fills its first slot
+        self._move_gap(index)
+        self._data[self._gap_start] = value
+        self._gap_start += 1
+        self._size += 1
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes an element at a specific index; O(1) amortized when index
+        is next to the previous edit
+
+        :param index: integer
+
+        :return: does not return
+        """
+        # Data validation
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException("Invalid index.")
+
+        # Checks if current buffer needs to be resized (shrunk) by the policy
+        new_cap = self._policy.shrink(self._size, self._capacity)
+        if new_cap != self._capacity:
+            self.resize(new_cap)
+
+        # Moves the gap to the index and widens it over the removed element
+        self._move_gap(index)
+        self._data[self._gap_end] = None if self._typecode is None else 0
+        self._gap_end += 1
+        self._size -= 1
+
+    def slice(self, start_index: int, size: int) -> "GapBuffer":
+        """
+        Slices a GapBuffer object creating a new GapBuffer object as a subset.
+
+        :param start_index: integer
+        :param size: integer
+
+        :return: a GapBuffer object
+        """
+        # Data Validation
+        if ((start_index < 0 or start_index >= self._size)
+                or (size > (self._size - start_index))
+                or (size < 0)):
+            raise DynamicArrayException
+
+        output_buf = GapBuffer(typecode=self._typecode, policy=self._policy)
+        for pos in range(start_index, start_index + size):
+            output_buf.append(self[pos])
+
+        return output_buf
+
+    def merge(self, second_da) -> None:
+        """
+        Appends every element of a GapBuffer or DynamicArray object
+
+        :param second_da: GapBuffer or DynamicArray object
+
+        :return: does not return
+        """
+        for pos in range(second_da.length()):
+            self.append(second_da[pos])
+
+    def map(self, map_func) -> "GapBuffer":
+        """
+        Creates a new GapBuffer object by applying a function to each element.
+
+        :param map_func: a function
+
+        :return: a GapBuffer object
+        """
+        output_buf = GapBuffer(policy=self._policy)
+        for pos in range(self._size):
+            output_buf.append(map_func(self[pos]))
+
+        return output_buf
+
+    def filter(self, filter_func) -> "GapBuffer":
+        """
+        Creates a new GapBuffer object with the elements for which
+        filter_func returns True.
+
+        :param filter_func: a function
+
+        :return: a GapBuffer object
+        """
+        output_buf = GapBuffer(typecode=self._typecode, policy=self._policy)
+        for pos in range(self._size):
+            if filter_func(self[pos]):
+                output_buf.append(self[pos])
+
+        return output_buf
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Applies a function cumulatively to all elements, with the same
+        rules as DynamicArray.reduce().
+
+        :param reduce_func: a function
+        :param initializer: an integer
+
+        :return: an integer or None
+        """
+        if self._size == 0:
+            return initializer
+
+        result, start = initializer, 0
+        if initializer is None:
+            result, start = self[0], 1
+
+        for pos in range(start, self._size):
+            result = reduce_func(result, self[pos])
+
+        return result
+
+    def lazy(self) -> LazyDynamicArray:
+        """
+        Returns a lazy view of the current buffer on which map, filter and
+        slice calls are recorded instead of executed (its to_array()
+        returns a DynamicArray).
+
+        :param: a GapBuffer instance
+
+        :return: a LazyDynamicArray object
+        """
+        return LazyDynamicArray(self)
+
+    def pop(self) -> None:
+        """
+        Removes the element at the end of the GapBuffer object
+
+        :param: a GapBuffer instance
+
+        :return: does not return
+        """
+        if self._size == 0:
+            raise DynamicArrayException
+
+        self._move_gap(self._size)
+        self._gap_start -= 1
+        self._data[self._gap_start] = None if self._typecode is None else 0
+        self._size -= 1
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# insert_at_index - example 1")
+    gb = GapBuffer([100])
+    print(gb)
+    gb.insert_at_index(0, 200)
+    gb.insert_at_index(0, 300)
+    gb.insert_at_index(0, 400)
+    print(gb)
+    gb.insert_at_index(3, 500)
+    print(gb)
+    gb.insert_at_index(1, 600)
+    print(gb)
+
+    print("\n# remove_at_index - example 1")
+    gb = GapBuffer([10, 20, 30, 40, 50, 60, 70, 80])
+    print(gb)
+    gb.remove_at_index(0)
+    print(gb)
+    gb.remove_at_index(6)
+    print(gb)
+    gb.remove_at_index(2)
+    print(gb)
+
+    print("\n# editing at a cursor - example 1")
+    gb = GapBuffer("hello world")
+    cursor = 5
+    for letter in ", dear":
+        gb.insert_at_index(cursor, letter)
+        cursor += 1
+    print(''.join(gb))
+    for _ in range(6):
+        cursor -= 1
+        gb.remove_at_index(cursor)
+    print(''.join(gb), gb.length(), gb.get_capacity())
+
+    print("\n# slice / map / filter / reduce - example 1")
+    gb = GapBuffer([1, 5, 10, 15, 20, 25])
+    print(gb.slice(1, 3))
+    print(gb.map(lambda x: x ** 2))
+    print(gb.filter(lambda x: x > 10))
+    print(gb.reduce(lambda x, y: x + y), gb.reduce(lambda x, y: x + y, -1))
+    gb.pop()
+    print(gb)
+    print(gb.lazy().map(lambda x: x * 3).filter(lambda x: x > 10).to_array())
+
+    print("\n# reserve / shrink_to_fit / get_memoryview - example 1")
+    gb = GapBuffer([1, 2, 3, 4, 5], typecode='q')
+    gb.insert_at_index(1, 10)
+    gb.print_da_variables()
+    gb.reserve(100)
+    print(gb.length(), gb.get_capacity(), gb.get_resize_stats())
+    view = gb.get_memoryview()
+    print(view.tolist(), view.format)
+    view.release()
+    gb.shrink_to_fit()
+    print(gb, gb.get_resize_stats())
@@ -0,0 +1,123 @@
+# Course: CS261 - Data Structures
+# Description: Growth policies for DynamicArray. A policy decides the new
+#              capacity when the array is full and whether it should shrink
+#              after a removal. The gap between the shrink threshold and the
+#              capacity after shrinking (hysteresis) keeps alternating
+#              append/remove workloads from resizing on every operation.
+
+from abc import ABC, abstractmethod
+
+
+class GrowthPolicyException(Exception):
+    """
+    Custom exception to be used by growth policies
+    """
+    pass
+
+
+class GrowthPolicy(ABC):
+    """
+    Abstract base class for DynamicArray growth policies.
+    Subclasses must implement grow(); shrink() is shared.
+    """
+
+    def __init__(self, shrink_below: float = 0.25, shrink_to: float = 2,
+                 min_capacity: int = 10) -> None:
+        """
+        Initialize a policy which shrinks the array to shrink_to times its
+        size once the size drops below shrink_below times the capacity,
+        but never below min_capacity. shrink_below = 0 disables shrinking.
+        """
+        if shrink_to <= 1 or shrink_below < 0 or shrink_below * shrink_to >= 1:
+            raise GrowthPolicyException('Shrink settings leave no hysteresis')
+        self._shrink_below = shrink_below
+        self._shrink_to = shrink_to
+        self._min_capacity = min_capacity
+
+    @abstractmethod
+    def grow(self, capacity: int, needed: int) -> int:
+        """
+        Returns the new capacity for a full array which needs to hold at
+        least needed elements.
+
+        :param capacity: an integer (current capacity)
+        :param needed: an integer (minimum new capacity)
+
+        :return: an integer
+        """
+
+    def shrink(self, size: int, capacity: int) -> int:
+        """
+        Returns the capacity the array should have with size elements
+        (the current capacity if it should not shrink).
+
+        :param size: an integer (current number of elements)
+        :param capacity: an integer (current capacity)
+
+        :return: an integer
+        """
+        if capacity > self._min_capacity and size < capacity * self._shrink_below:
+            return max(int(size * self._shrink_to), self._min_capacity)
+        return capacity
+
+
+class DoublingPolicy(GrowthPolicy):
+    """
+    Doubles the capacity when full (the default DynamicArray behavior).
+    """
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """Return twice the capacity (or needed if larger)."""
+        return max(capacity * 2, needed)
+
+
+class FactorPolicy(GrowthPolicy):
+    """
+    Multiplies the capacity by a given factor when full. A factor of 1.5
+    wastes at most a third of the memory instead of half.
+    """
+
+    def __init__(self, factor: float = 1.5, **kwargs) -> None:
+        """Initialize a policy growing by factor (must be > 1)."""
+        if factor <= 1:
+            raise GrowthPolicyException('Growth factor must be greater than 1')
+        super().__init__(**kwargs)
+        self._factor = factor
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """Return capacity times the factor (always at least one more slot)."""
+        return max(int(capacity * self._factor), capacity + 1, needed)
+
+
+class PagePolicy(GrowthPolicy):
+    """
+    Grows and shrinks the capacity in whole pages of page_size elements,
+    so huge arrays waste at most one page.
+    """
+
+    def __init__(self, page_size: int = 1024, **kwargs) -> None:
+        """Initialize a policy growing in steps of page_size elements."""
+        if page_size < 1:
+            raise GrowthPolicyException('Page size must be a positive integer')
+        super().__init__(**kwargs)
+        self._page_size = page_size
+
+    def _round_up(self, count: int) -> int:
+        """Round count up to a whole number of pages."""
+        pages = max(1, -(-count // self._page_size))
+        return pages * self._page_size
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """Return needed rounded up to the next page."""
+        return self._round_up(max(capacity + 1, needed))
+
+    def shrink(self, size: int, capacity: int) -> int:
+        """Shrink like the base policy, keeping whole pages."""
+        new_capacity = super().shrink(size, capacity)
+        if new_capacity == capacity:
+            return capacity
+        new_capacity = self._round_up(new_capacity)
+        return new_capacity if new_capacity < capacity else capacity
+
+
+DEFAULT_POLICY = DoublingPolicy()
@@ -0,0 +1,182 @@
+# Course: CS261 - Data Structures
+# Description: Hash quality analysis for the HashMaps (SC & OA). Reports
+#              chain-length and probe-length distributions, the empty-bucket
+#              ratio and the predicted lookup cost of a map for a corpus of
+#              keys, compares hash functions and capacities on a corpus, and
+#              benchmarks the probing strategies of the open addressing map.
+
+
+import sys
+import time
+
+from a6_include import hash_function_1, hash_function_2
+from hashing import builtin_hash, crc_hash, fnv1a_hash, keyed_hash, xxhash64
+import hash_map_oa
+import hash_map_sc
+
+
+class HashMapReport:
+    """
+    Statistics of one HashMap (SC or OA) for a corpus of keys.
+    Histograms map a length to the number of buckets / keys with it.
+    """
+
+    def __init__(self, hash_map, keys) -> None:
+        """
+        Analyze hash_map for the given keys (any iterable of keys; keys
+        which are not in the map count as unsuccessful lookups)
+        """
+        self.function = hash_map._hash_function.__name__
+        self.size = hash_map.get_size()
+        self.capacity = hash_map.get_capacity()
+        self.load = hash_map.table_load()
+        self.empty_buckets = hash_map.empty_buckets()
+        self.empty_ratio = self.empty_buckets / self.capacity
+
+        # Chain lengths only exist with separate chaining
+        self.chain_histogram = None
+        if isinstance(hash_map, hash_map_sc.HashMap):
+            self.chain_histogram = {}
+            for index in range(self.capacity):
+                length = hash_map._buckets[index].length()
+                self.chain_histogram[length] = self.chain_histogram.get(length, 0) + 1
+
+        # Cost of looking up every key of the corpus
+        self.probe_histogram = {}
+        hits = misses = hit_cost = miss_cost = 0
+        self.max_probes = 0
+        for key in keys:
+            probes = hash_map._probe_count(key)
+            self.probe_histogram[probes] = self.probe_histogram.get(probes, 0) + 1
+            self.max_probes = max(self.max_probes, probes)
+            if hash_map.contains_key(key):
+                hits += 1
+                hit_cost += probes
+            else:
+                misses += 1
+                miss_cost += probes
+
+        self.hit_cost = hit_cost / hits if hits else 0.0
+        self.miss_cost = miss_cost / misses if misses else 0.0
+        self.lookup_cost = (hit_cost + miss_cost) / max(hits + misses, 1)
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        out = (f"{self.function}: size {self.size}, capacity {self.capacity}, "
+               f"load {self.load:.2f}, empty {self.empty_ratio:.1%}\n")
+        if self.chain_histogram is not None:
+            out += "  chain lengths: " + _format_histogram(self.chain_histogram) + "\n"
+        out += "  probe lengths: " + _format_histogram(self.probe_histogram) + "\n"
+        out += (f"  probes per lookup: {self.lookup_cost:.2f} "
+                f"(hit {self.hit_cost:.2f}, miss {self.miss_cost:.2f}, max {self.max_probes})")
+        return out
+
+
+def _format_histogram(histogram: dict) -> str:
+    """Helper function which formats a histogram as 'length: count' pairs."""
+    return ", ".join(f"{length}: {histogram[length]}" for length in sorted(histogram))
+
+
+def analyze(hash_map, keys) -> HashMapReport:
+    """
+    Builds a report of hash_map for a corpus of keys.
+
+    :param hash_map: a hash_map_sc.HashMap or hash_map_oa.HashMap object
+    :param keys: an iterable of keys
+
+    :return: a HashMapReport object
+    """
+    return HashMapReport(hash_map, keys)
+
+
+def compare(keys, functions, capacity: int = 11, map_class=hash_map_sc.HashMap,
+            lookups=None) -> list:
+    """
+    Loads every key into a new map per hash function and reports each.
+
+    :param keys: a list of keys to insert
+    :param functions: an iterable of hash functions
+    :param capacity: an integer (initial capacity of each map)
+    :param map_class: hash_map_sc.HashMap or hash_map_oa.HashMap
+    :param lookups: keys to look up (default: keys)
+
+    :return: a list of HashMapReport objects, one per function
+    """
+    reports = []
+    for function in functions:
+        hash_map = map_class(capacity, function)
+        for key in keys:
+            hash_map.put(key, None)
+        reports.append(analyze(hash_map, keys if lookups is None else lookups))
+    return reports
+
+
+def _table_bytes(hash_map) -> int:
+    """Helper function which sums the size of the slot arrays of an OA map."""
+    return sum(sys.getsizeof(table) for table in
+               (hash_map._hashes, hash_map._keys, hash_map._values, hash_map._states))
+
+
+def benchmark_probing(keys, function=builtin_hash, strategies=None, lookups=None) -> list:
+    """
+    Loads every key into an open addressing map per probing strategy
+    (each at its default maximum load) and measures the memory of the
+    slot arrays, put and get latency and the probes per lookup.
+
+    :param keys: a list of keys to insert
+    :param function: a hash function
+    :param strategies: an iterable of probing names (default: all of them)
+    :param lookups: keys to look up (default: keys)
+
+    :return: a list of (probing, capacity, bytes, put ns, get ns,
+             HashMapReport) tuples, one per strategy
+    """
+    if strategies is None:
+        strategies = hash_map_oa.PROBING_LOADS
+    if lookups is None:
+        lookups = keys
+
+    results = []
+    for probing in strategies:
+        hash_map = hash_map_oa.HashMap(11, function, probing=probing)
+
+        start = time.perf_counter_ns()
+        for key in keys:
+            hash_map.put(key, None)
+        put_ns = (time.perf_counter_ns() - start) / max(len(keys), 1)
+
+        start = time.perf_counter_ns()
+        for key in lookups:
+            hash_map.get(key)
+        get_ns = (time.perf_counter_ns() - start) / max(len(lookups), 1)
+
+        results.append((probing, hash_map.get_capacity(), _table_bytes(hash_map),
+                        put_ns, get_ns, analyze(hash_map, lookups)))
+    return results
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    keys = ["key" + str(i) for i in range(1000)]
+    lookups = keys + ["missing" + str(i) for i in range(1000)]
+    functions = (hash_function_1, hash_function_2, fnv1a_hash, xxhash64, crc_hash, keyed_hash)
+
+    print("\n# separate chaining")
+    for report in compare(keys, functions, 1009, hash_map_sc.HashMap, lookups):
+        print(report)
+
+    print("\n# open addressing")
+    for report in compare(keys, functions, 2003, hash_map_oa.HashMap, lookups):
+        print(report)
+
+    print("\n# probing strategies")
+    keys = ["key" + str(i) for i in range(20000)]
+    lookups = keys + ["missing" + str(i) for i in range(20000)]
+    for probing, capacity, size, put_ns, get_ns, report in benchmark_probing(keys, lookups=lookups):
+        print(f"{probing}: capacity {capacity}, load {report.load:.2f}, {size} bytes, "
+              f"put {put_ns:.0f} ns, get {get_ns:.0f} ns, "
+              f"probes per lookup {report.lookup_cost:.2f} "
+              f"(hit {report.hit_cost:.2f}, miss {report.miss_cost:.2f}, max {report.max_probes})")
@@ -0,0 +1,466 @@
+# Course: CS261 - Data Structures
+# Description: HashMap using cuckoo hashing for collision resolution. Every
+#              key lives in one of two slots (one per table, chosen by two
+#              hash functions) or in a small bounded stash, so a lookup
+#              inspects at most two slots plus the stash, whatever the load.
+#              Inserting kicks the current occupant over to its other slot.
+#              The two hash functions must be independent and spread keys
+#              over a wide range: with hash_function_1/2, keys such as
+#              anagrams share both slots and soon overflow the stash. The
+#              defaults, builtin_hash (SipHash) and crc_hash (CRC-32), both
+#              run in C; builtin_hash is seeded per process, so the layout
+#              of the tables changes between runs (pass crc_hash and
+#              keyed_hash for a stable one).
+
+from a6_include import DynamicArray, HashEntry, builtin_hash, crc_hash
+from primes import is_prime, next_prime
+
+
+# Entries are (hash_1, hash_2, key, value) tuples; both hashes are cached
+# so kicked entries move to their other table without rehashing the key
+_HASH_1 = 0
+_HASH_2 = 1
+_KEY = 2
+_VALUE = 3
+
+# Rebuilds at a doubled capacity tried before giving up on a key
+_MAX_REBUILDS = 4
+
+
+class HashMapException(Exception):
+    """
+    Custom exception to be used by HashMap class
+    """
+    pass
+
+
+class HashMap:
+    def __init__(self, capacity: int = 11, function_1=builtin_hash,
+                 function_2=crc_hash, stash_size: int = 4,
+                 max_load: float = 0.45) -> None:
+        """
+        Initialize new HashMap that uses cuckoo hashing for collision
+        resolution: two tables of (at least) capacity slots each, indexed
+        by function_1 and function_2, and a stash of up to stash_size
+        entries which could not be placed. The tables are resized once
+        the load factor (over both tables) reaches max_load
+        """
+        if not 0 < max_load <= 0.5:
+            raise HashMapException('Cuckoo tables need a maximum load of at most 0.5')
+        self._function_1 = function_1
+        self._function_2 = function_2
+        self._stash_size = stash_size
+        self._max_load = max_load
+
+        # capacity (of each table) must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for number, table in enumerate(self._tables):
+            for index in range(self._capacity):
+                out += f"T{number + 1} {index}: {self._format(table[index])}\n"
+        for entry in self._stash:
+            out += f"stash: {self._format(entry)}\n"
+        return out
+
+    @staticmethod
+    def _format(entry: tuple) -> str:
+        """
+        Helper method which formats an entry (or None) like a HashEntry
+        """
+        if entry is None:
+            return 'None'
+        return str(HashEntry(entry[_KEY], entry[_VALUE]))
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Find the closest odd prime number >= capacity (shared primes
+        module: prime ladder, then Miller-Rabin)
+        """
+        return next_prime(max(capacity, 3))
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        return is_prime(capacity)
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map (slots of both tables)
+        """
+        return 2 * self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Helper method which allocates two empty tables of capacity slots
+        and an empty stash.
+
+        :param capacity: an integer
+
+        :return: does not return
+        """
+        self._tables = ([None] * capacity, [None] * capacity)
+        self._stash = []
+
+        # An insertion which kicks more entries than this is cycling
+        self._max_kicks = max(16, 4 * capacity.bit_length())
+
+    def _locate(self, key: str) -> tuple:
+        """
+        Helper method which finds the slot holding key: its slot in the
+        first table, its slot in the second table, then the stash.
+
+        :param key: a Python string instance
+
+        :return: a tuple (list holding the entry, index, hash_1, hash_2),
+                 with (None, -1) as the first two items if key is absent;
+                 hash_2 is None if key was found in the first table
+        """
+        hash_1 = self._function_1(key)
+        table, index = self._tables[0], hash_1 % self._capacity
+        entry = table[index]
+        if entry is not None and entry[_HASH_1] == hash_1 and entry[_KEY] == key:
+            return table, index, hash_1, None
+
+        hash_2 = self._function_2(key)
+        table, index = self._tables[1], hash_2 % self._capacity
+        entry = table[index]
+        if entry is not None and entry[_HASH_2] == hash_2 and entry[_KEY] == key:
+            return table, index, hash_1, hash_2
+
+        for index in range(len(self._stash)):
+            if self._stash[index][_KEY] == key:
+                return self._stash, index, hash_1, hash_2
+
+        return None, -1, hash_1, hash_2
+
+    def _place(self, entry: tuple) -> tuple:
+        """
+        Helper method which stores an entry for a key known to be absent:
+        in a free slot of its own if there is one, otherwise by kicking
+        occupants over to their other table, a bounded number of times.
+        If the kicks don't end in a free slot they are undone, so the
+        tables are left as they were.
+
+        :param entry: a (hash_1, hash_2, key, value) tuple
+
+        :return: None if the entry was placed, otherwise the entry itself
+        """
+        first, second = self._tables
+        index_1 = entry[_HASH_1] % self._capacity
+        if first[index_1] is None:
+            first[index_1] = entry
+            return None
+
+        index_2 = entry[_HASH_2] % self._capacity
+        if second[index_2] is None:
+            second[index_2] = entry
+            return None
+
+        # Takes the first slot and moves each kicked entry to its other table
+        number, path = 0, []
+        for _ in range(self._max_kicks):
+            table = self._tables[number]
+            index = entry[number] % self._capacity
+            entry, table[index] = table[index], entry
+            if entry is None:
+                return None
+            path.append((table, index))
+            number = 1 - number
+
+        # Puts every kicked entry back, ending with the one being placed
+        for table, index in reversed(path):
+            entry, table[index] = table[index], entry
+
+        return entry
+
+    def _insert(self, entry: tuple) -> tuple:
+        """
+        Helper method which places an entry, keeping the one left over in
+        the stash if there is room.
+
+        :param entry: a (hash_1, hash_2, key, value) tuple
+
+        :return: the entry which overflowed the stash, or None
+        """
+        homeless = self._place(entry)
+        if homeless is not None and len(self._stash) < self._stash_size:
+            self._stash.append(homeless)
+            return None
+
+        return homeless
+
+    def _entries(self):
+        """
+        Helper method which yields every entry of both tables and the stash.
+        """
+        for table in self._tables:
+            for entry in table:
+                if entry is not None:
+                    yield entry
+        yield from self._stash
+
+    def _rebuild(self, new_capacity: int, entries: list) -> None:
+        """
+        Helper method which reinserts entries into new tables, doubling
+        the capacity again whenever an entry can't be placed. If every
+        attempt fails, the previous tables are restored before raising.
+
+        :param new_capacity: an integer
+        :param entries: a list of (hash_1, hash_2, key, value) tuples
+
+        :return: does not return
+        """
+        saved = self._capacity, self._tables, self._stash, self._max_kicks
+
+        for _ in range(_MAX_REBUILDS):
+            self._capacity = self._next_prime(new_capacity)
+            self._allocate(self._capacity)
+            if all(self._insert(entry) is None for entry in entries):
+                return
+            new_capacity = self._capacity * 2
+
+        self._capacity, self._tables, self._stash, self._max_kicks = saved
+        raise HashMapException('Too many keys share both hashes to be stored')
+
+    def _unstash(self) -> None:
+        """
+        Helper method which moves stashed entries into free slots of
+        their own (without kicking), e.g. after a removal.
+
+        :param: a Hashmap object
+
+        :return: does not return
+        """
+        first, second = self._tables
+        for entry in list(self._stash):
+            index_1 = entry[_HASH_1] % self._capacity
+            index_2 = entry[_HASH_2] % self._capacity
+            if first[index_1] is None:
+                first[index_1] = entry
+            elif second[index_2] is None:
+                second[index_2] = entry
+            else:
+                continue
+            self._stash.remove(entry)
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in a Hashmap object.
+
+        :param key: a Python string instance.
+        :param value: any Python object
+
+        :return: does not return
+        """
+        table, index, hash_1, hash_2 = self._locate(key)
+
+        # Replaces value if key matches
+        if table is not None:
+            entry = table[index]
+            table[index] = (entry[_HASH_1], entry[_HASH_2], key, value)
+            return
+
+        # Checks if load factor is >= max load and if it is resizes the hash
+        if (self._size + 1) / self.get_capacity() > self._max_load:
+            self.resize_table(self._capacity * 2)
+
+        # A failed insertion leaves the stored entries in place, so a key
+        # which can't be stored is rejected without losing any other
+        entry = (hash_1, hash_2, key, value)
+        if self._insert(entry) is not None:
+            self._rebuild(self._capacity * 2, list(self._entries()) + [entry])
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes both tables to a new capacity (each) and reinserts all
+        key/value pairs, reusing their cached hashes.
+
+        :param new_capacity: an integer
+
+        :return: does not return
+        """
+        # Checks if the tables can hold the items
+        if 2 * new_capacity * self._max_load < self.get_size():
+            return
+
+        self._rebuild(new_capacity, list(self._entries()))
+
+    def table_load(self) -> float:
+        """
+        Calculates and returns the current hash table load factor.
+
+        :param: a Hashmap object
+
+        :return: a float
+        """
+        return self.get_size() / self.get_capacity()
+
+    def empty_buckets(self) -> int:
+        """
+        Checks and returns the number of empty slots in both tables.
+
+        :param: a Hashmap object
+
+        :return: an integer
+        """
+        return self.get_capacity() - (self._size - len(self._stash))
+
+    def get(self, key: str) -> object:
+        """
+        Finds the value associated to a key in a Hashmap object
+        (inspecting at most two slots and the stash).
+
+        :param key: a Python string instance
+
+        :return: any Python object
+        """
+        table, index, _, _ = self._locate(key)
+        return table[index][_VALUE] if table is not None else None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Checks if a key passed as a parameter exists in a Hashmap object
+
+        :param key: a Python string instance.
+
+        :return: a Boolean (True if the key is in the Hashmap object, False otherwise).
+        """
+        return self._locate(key)[0] is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the key passed as parameter and its associated value from the Hashmap object.
+
+        :param key: a Python string instance.
+
+        :return: does not return
+        """
+        table, index, _, _ = self._locate(key)
+        if table is None:
+            return
+
+        self._size -= 1
+        if table is self._stash:
+            del self._stash[index]
+            return
+
+        # The freed slot may be the home of a stashed entry
+        table[index] = None
+        if self._stash:
+            self._unstash()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Traverses a Hashmap object and retrieves keys/values tuples stored in it.
+
+        :param: a Hashmap object.
+
+        :return: DynamicArrays instances containing tuples of keys/values
+        """
+        final_array = DynamicArray()
+        for entry in self._entries():
+            final_array.append((entry[_KEY], entry[_VALUE]))
+
+        return final_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of a Hashmap object without changing its capacity.
+
+        :param key: a Hashmap object
+
+        :return: does not return
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def __iter__(self):
+        """
+        Returns an iterator for the hash map.
+
+        :param: a Hashmap object
+
+        :return: an iterator
+        """
+        self._iterator = self._entries()
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map.
+
+        :param: a Hashmap object
+
+        :return: the next key/value pair in the hash map (as a HashEntry)
+        """
+        entry = next(self._iterator)
+        return HashEntry(entry[_KEY], entry[_VALUE], entry[_HASH_1])
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    from a6_include import hash_function_1, keyed_hash
+
+    print("\nput / get example 1")
+    print("---------------------")
+    m = HashMap(5, crc_hash, keyed_hash)
+    for key in ['listen', 'silent', 'enlist', 'tinsel', 'inlets']:
+        m.put(key, len(key))
+    print(m)
+    print(m.get_size(), m.get_capacity(), m.get('tinsel'), m.get('lentis'))
+
+    print("\nput / remove example 1")
+    print("---------------------")
+    m = HashMap(11)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 30 == 29:
+            print(m.get_size(), m.get_capacity(), round(m.table_load(), 2),
+                  m.empty_buckets(), m.get('str' + str(i // 2)))
+    for i in range(0, 150, 3):
+        m.remove('str' + str(i))
+    print(m.get_size(), m.contains_key('str3'), m.contains_key('str4'))
+
+    print("\nget_keys_and_values example 1")
+    print("---------------------")
+    m = HashMap(11, crc_hash, keyed_hash)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    m.put('2', 'twenty')
+    print(m.get_keys_and_values())
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
+    m.clear()
+    print(m.get_size(), m.get_capacity())
+
+    print("\nfailed put example 1")
+    print("---------------------")
+    m = HashMap(11, hash_function_1, hash_function_1)
+    keys = ['listen', 'silent', 'enlist', 'tinsel', 'inlets', 'elints', 'lentis']
+    try:
+        for key in keys:
+            m.put(key, key.upper())
+    except Exception as e:
+        print("Exception raised:", type(e))
+    print(m.get_size(), [m.contains_key(key) for key in keys])
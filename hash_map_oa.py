@@ -5,69 +5,193 @@
 # Due Date: Aug 13, 2024
 # Description: Creation of a Hashmap class using open addressing for collision resolution
 
-from a6_include import (DynamicArray, DynamicArrayException, HashEntry,
+from a6_include import (DynamicArray, DynamicArrayException, HashEntry, as_list,
                         hash_function_1, hash_function_2)
+from primes import is_prime, next_power_of_two, next_prime
+
+
+# Slot states stored in the one-byte-per-slot state array
+_EMPTY = 0
+_FULL = 1
+_TOMBSTONE = 2
+_PENDING = 3        # live entry not yet placed by compact()
+
+# Probing strategies and the load factor each one resizes at by default
+PROBING_LOADS = {
+    'quadratic': 0.5,       # h + i^2, only guaranteed to find a slot below 0.5
+    'double': 0.85,         # h + i * step(h), visits every slot of a prime table
+    'robin_hood': 0.9,      # linear probing with Robin Hood displacement
+}
+
+
+class HashMapException(Exception):
+    """
+    Custom exception to be used by HashMap class
+    """
+    pass
+
+
+def _probe_start(hash: int, capacity: int, probing: str) -> tuple:
+    """
+    Helper function which returns the start of a probe sequence as
+    (first index, first step, step increment); each next index is
+    index + step, after which step grows by the increment.
+
+    :param hash: an integer (hash of key)
+    :param capacity: an integer
+    :param probing: a probing strategy name
+
+    :return: a tuple of three integers
+    """
+    mask = capacity - 1
+    if capacity & mask == 0:
+        # power-of-two tables: triangular offsets (and odd double hashing
+        # steps) still visit every slot
+        if probing == 'quadratic':
+            return hash & mask, 1, 1
+        if probing == 'double':
+            return hash & mask, (hash >> capacity.bit_length()) & mask | 1, 0
+        return hash & mask, 1, 0
+
+    if probing == 'quadratic':
+        # consecutive squares differ by 1, 3, 5, ... so no squaring is needed
+        return hash % capacity, 1, 2
+    if probing == 'double':
+        return hash % capacity, 1 + (hash // capacity) % (capacity - 1), 0
+    return hash % capacity, 1, 0
+
+
+def _find_slot(states: bytearray, hashes: list, keys: list, key: str, hash: int,
+               probing: str = 'quadratic') -> int:
+    """
+    Helper function which probes a table (given by its parallel arrays)
+    for a key, comparing cached hashes before keys.
+
+    :param states: a bytearray (slot states)
+    :param hashes: a list (cached hashes)
+    :param keys: a list (keys)
+    :param key: a Python string instance
+    :param hash: an integer (hash of key)
+    :param probing: a probing strategy name
+
+    :return: an integer (slot index of key, or -1 if absent)
+    """
+    capacity = len(states)
+    index, step, step_inc = _probe_start(hash, capacity, probing)
+    robin_hood = probing == 'robin_hood'
+    distance = 0
+
+    while states[index] != _EMPTY and distance < capacity:
+        if hashes[index] == hash and states[index] == _FULL and keys[index] == key:
+            return index
+
+        # Robin Hood: the key would have displaced any entry closer to its home
+        if robin_hood and (index - hashes[index]) % capacity < distance:
+            return -1
+
+        index = (index + step) % capacity
+        step += step_inc
+        distance += 1
+
+    return -1
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    def __init__(self, capacity: int, function, incremental: bool = False,
+                 migrate_batch: int = 8, probing: str = 'quadratic',
+                 max_load: float = None, tombstone_limit: float = 0.25,
+                 power_of_two: bool = False) -> None:
         """
-        Initialize new HashMap that uses
-        quadratic probing for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize new HashMap that uses open addressing for collision
+        resolution: quadratic probing by default, or 'double' hashing or
+        'robin_hood' linear probing, resizing once the load factor reaches
+        max_load (default: PROBING_LOADS[probing])
+        With incremental=True, automatic resizes move migrate_batch slots
+        of the old table per operation instead of rehashing all at once
+        The table is compacted in place once tombstones take up more than
+        tombstone_limit of the capacity (None: only when a put needs it)
+        With power_of_two=True, capacities are powers of two and slots are
+        picked with a bit mask (only for hash functions that mix well)
         """
-        self._buckets = DynamicArray()
-
-        # capacity must be a prime number
-        self._capacity = self._next_prime(capacity)
-        for _ in range(self._capacity):
-            self._buckets.append(None)
+        if probing not in PROBING_LOADS:
+            raise HashMapException('Unknown probing strategy: ' + str(probing))
+        if max_load is None:
+            max_load = PROBING_LOADS[probing]
+        if not 0 < max_load < 1:
+            raise HashMapException('Maximum load factor must be between 0 and 1')
+
+        # quadratic probing only reaches half of the slots of a prime table
+        if probing == 'quadratic' and max_load > 0.5:
+            raise HashMapException('Quadratic probing needs a maximum load of at most 0.5')
+        self._probing = probing
+        self._max_load = max_load
+        self._tombstone_limit = tombstone_limit
+        self._power_of_two = power_of_two
+
+        # capacity must be a prime number (or a power of two)
+        self._capacity = self._round_capacity(capacity)
+        self._allocate(self._capacity)
 
         self._hash_function = function
         self._size = 0
 
+        # Old table (hashes, keys, values, states) while it is being migrated
+        self._incremental = incremental
+        self._migrate_batch = max(2, migrate_batch)
+        self._old = None
+        self._old_index = 0
+
     def __str__(self) -> str:
         """
         Override string method to provide more readable output
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
+        self._finish_migration()
         out = ''
-        for i in range(self._buckets.length()):
-            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        for i in range(self._capacity):
+            out += str(i) + ': ' + str(self._entry_at(i)) + '\n'
         return out
 
     def _next_prime(self, capacity: int) -> int:
         """
-        Increment from given number to find the closest prime number
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Find the closest odd prime number >= capacity (shared primes
+        module: prime ladder, then Miller-Rabin)
         """
-        if capacity % 2 == 0:
-            capacity += 1
-
-        while not self._is_prime(capacity):
-            capacity += 2
-
-        return capacity
+        return next_prime(max(capacity, 3))
 
     @staticmethod
     def _is_prime(capacity: int) -> bool:
         """
         Determine if given integer is a prime number and return boolean
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
-        if capacity == 2 or capacity == 3:
-            return True
+        return is_prime(capacity)
 
-        if capacity == 1 or capacity % 2 == 0:
-            return False
+    @classmethod
+    def with_expected_size(cls, expected_size: int, function, **kwargs) -> "HashMap":
+        """
+        Creates a HashMap which holds expected_size keys without resizing,
+        its capacity rounded up to the smallest prime that fits them.
 
-        factor = 3
-        while factor ** 2 <= capacity:
-            if capacity % factor == 0:
-                return False
-            factor += 2
+        :param expected_size: an integer
+        :param function: a hash function
+        :param kwargs: any other HashMap argument (probing, max_load, ...)
 
-        return True
+        :return: a HashMap object
+        """
+        max_load = kwargs.get('max_load')
+        if max_load is None:
+            max_load = PROBING_LOADS.get(kwargs.get('probing', 'quadratic'), 0.5)
+        capacity = int(expected_size / max_load) + 1
+        # The constructor rounds capacity up with next_prime (or to a
+        # power of two); the coarser prime ladder is only for growth steps
+        return cls(capacity, function, **kwargs)
+
+    def _round_capacity(self, capacity: int) -> int:
+        """
+        Round capacity up to a prime (or a power of two)
+        """
+        if self._power_of_two:
+            return next_power_of_two(capacity)
+        return self._next_prime(capacity)
 
     def get_size(self) -> int:
         """
@@ -85,56 +209,311 @@ class HashMap:
 
     # ------------------------------------------------------------------ #
 
-    def put(self, key: str, value: object) -> None:
+    def _allocate(self, capacity: int) -> None:
         """
-        Updates the key/value pair in a Hashmap object.
+        Helper method which allocates empty parallel arrays for the table:
+        cached hashes, keys, values and a byte of state per slot.
 
-        :param key: a Python string instance.
+        :param capacity: an integer
+
+        :return: does not return
+        """
+        self._hashes = [0] * capacity
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+        self._states = bytearray(capacity)
+        self._tombstones = 0
+
+    def _entry_at(self, index: int) -> HashEntry:
+        """
+        Helper method which builds a HashEntry view of a slot
+        (None for an empty slot).
+
+        :param index: an integer
+
+        :return: a HashEntry object or None
+        """
+        state = self._states[index]
+        if state == _EMPTY:
+            return None
+
+        entry = HashEntry(self._keys[index], self._values[index], self._hashes[index])
+        entry.is_tombstone = state == _TOMBSTONE
+        return entry
+
+    def _find_index(self, key: str, hash: int) -> int:
+        """
+        Helper method which probes for a key, comparing cached hashes
+        before keys.
+
+        :param key: a Python string instance
+        :param hash: an integer (hash of key)
+
+        :return: an integer (slot index of key, or -1 if absent)
+        """
+        return _find_slot(self._states, self._hashes, self._keys, key, hash, self._probing)
+
+    def _locate(self, key: str, hash: int) -> tuple:
+        """
+        Helper method which finds the table holding key; while resizing
+        incrementally it first migrates a batch of old slots and then
+        also searches the old table.
+
+        :param key: a Python string instance
+        :param hash: an integer (hash of key)
+
+        :return: a tuple (hashes, keys, values, states, index), index -1 if absent
+        """
+        if self._old is not None:
+            self._migrate_step()
+
+        index = self._find_index(key, hash)
+        if index >= 0 or self._old is None:
+            return self._hashes, self._keys, self._values, self._states, index
+
+        old_hashes, old_keys, old_values, old_states = self._old
+        return (old_hashes, old_keys, old_values, old_states,
+                _find_slot(old_states, old_hashes, old_keys, key, hash, self._probing))
+
+    def _insert_new(self, key: str, hash: int, value: object) -> None:
+        """
+        Helper method which stores a key known to be absent in the first
+        free (empty or tombstone) slot of its probe sequence; does not
+        change the size.
+
+        :param key: a Python string instance
+        :param hash: an integer (hash of key)
         :param value: any Python object
 
         :return: does not return
         """
+        states, hashes = self._states, self._hashes
+        keys, values = self._keys, self._values
+        capacity = self._capacity
+        index, step, step_inc = _probe_start(hash, capacity, self._probing)
+
+        if self._probing != 'robin_hood':
+            while states[index] == _FULL:
+                index = (index + step) % capacity
+                step += step_inc
+            if states[index] == _TOMBSTONE:
+                self._tombstones -= 1
+        else:
+            distance = 0
+            while states[index] == _FULL:
+                # Robin Hood: takes the slot of an entry closer to its home
+                # and carries on inserting that entry instead
+                existing = (index - hashes[index]) % capacity
+                if existing < distance:
+                    hashes[index], hash = hash, hashes[index]
+                    keys[index], key = key, keys[index]
+                    values[index], value = value, values[index]
+                    distance = existing
+                index = (index + 1) % capacity
+                distance += 1
+
+        states[index] = _FULL
+        hashes[index] = hash
+        keys[index] = key
+        values[index] = value
+
+    def _backward_shift(self, index: int) -> None:
+        """
+        Helper method which deletes the entry at index without a tombstone
+        (Robin Hood only): the following displaced entries move one slot
+        back towards their home.
+
+        :param index: an integer
+
+        :return: does not return
+        """
+        states, hashes = self._states, self._hashes
+        keys, values = self._keys, self._values
+        capacity = self._capacity
+
+        next_index = (index + 1) % capacity
+        while states[next_index] == _FULL and (next_index - hashes[next_index]) % capacity:
+            hashes[index] = hashes[next_index]
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            index, next_index = next_index, (next_index + 1) % capacity
+
+        states[index] = _EMPTY
+        keys[index] = values[index] = None
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Helper method which allocates a new table and keeps the current
+        one aside so its entries can be moved a batch at a time.
 
-        # Checks if load factor is >= 0.5 and if it is resizes the hash
-        load_factor = self.table_load()
-        if load_factor >= 0.5:
-            self.resize_table(self.get_capacity() * 2)
+        :param new_capacity: an integer
 
-        # Applies hash function to capacity to get hash index
-        hash_index = self._hash_function(key) % self.get_capacity()
+        :return: does not return
+        """
+        self._finish_migration()
+        self._old = (self._hashes, self._keys, self._values, self._states)
+        self._old_index = 0
+        self._capacity = self._round_capacity(new_capacity)
+        self._allocate(self._capacity)
 
-        # Start quadratic probing
-        quad_index = hash_index
-        prob_index = 1                              # Quadratic probe index
+    def _migrate_step(self, batch: int = None) -> None:
+        """
+        Helper method which moves the entries of the next batch of old
+        slots into the new table, turning the old slots into tombstones
+        so probes through them keep working.
 
-        # Traverses the array checking key/value pairs
-        while self._buckets.get_at_index(quad_index) is not None:
-            curr = self._buckets.get_at_index(quad_index)
+        :param batch: an integer (number of old slots; default migrate_batch)
 
-            # Replaces value if key matches and is not a tombstone
-            if curr.key == key and not curr.is_tombstone:
-                curr.value = value
+        :return: does not return
+        """
+        old_hashes, old_keys, old_values, old_states = self._old
+        stop = min(self._old_index + (batch or self._migrate_batch), len(old_states))
+
+        for index in range(self._old_index, stop):
+            if old_states[index] == _FULL:
+                self._insert_new(old_keys[index], old_hashes[index], old_values[index])
+                old_states[index] = _TOMBSTONE
+                old_keys[index] = old_values[index] = None
+
+        self._old_index = stop
+        if stop == len(old_states):
+            self._old = None
+
+    def _finish_migration(self) -> None:
+        """
+        Helper method which moves every remaining old entry (used before
+        operations that need the whole table).
+
+        :param: a Hashmap object
+
+        :return: does not return
+        """
+        if self._old is not None:
+            self._migrate_step(len(self._old[3]))
+
+    def is_resizing(self) -> bool:
+        """
+        Checks if an incremental resize is in progress.
+
+        :param: a Hashmap object
+
+        :return: a Boolean
+        """
+        return self._old is not None
+
+    def _probe_count(self, key: str) -> int:
+        """
+        Helper method which counts the slots a lookup of key inspects
+        (used by hash_analysis).
+
+        :param key: a Python string instance
+
+        :return: an integer
+        """
+        hash = self._hash_function(key)
+        states, hashes, keys = self._states, self._hashes, self._keys
+        capacity = self._capacity
+        index, step, step_inc = _probe_start(hash, capacity, self._probing)
+        count = 1
+
+        while states[index] != _EMPTY and count <= capacity:
+            if hashes[index] == hash and states[index] == _FULL and keys[index] == key:
+                return count
+            if self._probing == 'robin_hood' and (index - hashes[index]) % capacity < count - 1:
+                return count
+
+            index = (index + step) % capacity
+            step += step_inc
+            count += 1
+
+        return count
+
+    def _put_hashed(self, key: str, hash: int, value: object) -> None:
+        """
+        Helper method which updates the key/value pair given the hash of key.
+
+        :param key: a Python string instance
+        :param hash: an integer (hash of key)
+        :param value: any Python object
+
+        :return: does not return
+        """
+        # Checks if load factor is >= max load and if it is resizes the hash;
+        # if only tombstones push the table over it, compacts it instead
+        if self._size / self._capacity >= self._max_load:
+            if self._incremental:
+                self._start_migration(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity * 2)
+        elif (self._size + self._tombstones) / self._capacity >= self._max_load:
+            self.compact()
+
+        # While migrating, keys not moved yet are updated in the old table
+        if self._old is not None:
+            self._migrate_step()
+        if self._old is not None:
+            old_hashes, old_keys, old_values, old_states = self._old
+            index = _find_slot(old_states, old_hashes, old_keys, key, hash, self._probing)
+            if index >= 0:
+                old_values[index] = value
                 return
 
-            # If key matches but is a tombstone, places key/value on spot
-            if curr.key == key and curr.is_tombstone:
-                curr.value = value
-                curr.is_tombstone = False
+        # Robin Hood tables have no tombstones: update in place or displace
+        if self._probing == 'robin_hood':
+            index = self._find_index(key, hash)
+            if index >= 0:
+                self._values[index] = value
+            else:
+                self._insert_new(key, hash, value)
                 self._size += 1
+            return
+
+        states, hashes, keys = self._states, self._hashes, self._keys
+        capacity = self._capacity
+        index, step, step_inc = _probe_start(hash, capacity, self._probing)
+
+        # Probes remembering the first reusable tombstone
+        free_index = -1
+
+        while states[index] != _EMPTY:
+            if states[index] == _TOMBSTONE:
+                if free_index < 0:
+                    free_index = index
+
+            # Replaces value if key matches
+            elif hashes[index] == hash and keys[index] == key:
+                self._values[index] = value
                 return
 
-            # Recalculates new quad index using quadratic probing formula
-            quad_index = (hash_index + prob_index ** 2) % self._capacity
-            prob_index += 1
+            index = (index + step) % capacity
+            step += step_inc
 
         # If no match is found, insert a new entry
-        self._buckets.set_at_index(quad_index, HashEntry(key, value))
+        if free_index < 0:
+            free_index = index
+        else:
+            self._tombstones -= 1
+        states[free_index] = _FULL
+        hashes[free_index] = hash
+        keys[free_index] = key
+        self._values[free_index] = value
         self._size += 1
 
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in a Hashmap object.
+
+        :param key: a Python string instance.
+        :param value: any Python object
+
+        :return: does not return
+        """
+        self._put_hashed(key, self._hash_function(key), value)
+
     def resize_table(self, new_capacity: int) -> None:
         """
         Resizes the hash map to a new capacity and rehashes all
-        key/value pairs.
+        key/value pairs, reusing their cached hashes.
 
         :param new_capacity: an integer
 
@@ -145,23 +524,21 @@ class HashMap:
         if new_capacity < self.get_size():
             return
 
-        new_capacity = self._next_prime(new_capacity)
+        self._finish_migration()
+
+        new_capacity = self._round_capacity(new_capacity)
 
-        # Stores the current buckets and reset the hash map
-        curr_buckets = self._buckets
-        self._buckets = DynamicArray()
+        # Stores the current arrays and reset the hash map
+        states, hashes = self._states, self._hashes
+        keys, values = self._keys, self._values
         self._capacity = new_capacity
+        self._allocate(new_capacity)
         self._size = 0
 
-        # Initializes new buckets
-        for _ in range(self._capacity):
-            self._buckets.append(None)
-
-        # Rehashes all non-tombstone entries from the current buckets
-        for index in range(curr_buckets.length()):
-            curr = curr_buckets.get_at_index(index)
-            if curr is not None and not curr.is_tombstone:
-                self.put(curr.key, curr.value)
+        # Rehashes all live entries from the current arrays
+        for index in range(len(states)):
+            if states[index] == _FULL:
+                self._put_hashed(keys[index], hashes[index], values[index])
 
     def table_load(self) -> float:
         """
@@ -181,13 +558,8 @@ class HashMap:
 
         :return: an integer
         """
-        count = 0
-        for index in range(self._buckets.length()):
-            if (self._buckets.get_at_index(index) is None or
-                    self._buckets.get_at_index(index).is_tombstone):
-                count += 1
-
-        return count
+        self._finish_migration()
+        return self._capacity - self._states.count(_FULL)
 
     def get(self, key: str) -> object:
         """
@@ -197,84 +569,171 @@ class HashMap:
 
         :return: any Python object
         """
-        # Applies hash function to capacity to get hash index
-        hash_index = self._hash_function(key) % self.get_capacity()
+        _, _, values, _, index = self._locate(key, self._hash_function(key))
+        return values[index] if index >= 0 else None
 
-        # Start quadratic probing
-        quad_index = hash_index
-        prob_index = 1
+    def contains_key(self, key: str) -> bool:
+        """
+        Checks if a key passed as a parameter exists in a Hashmap object
 
-        # Traverses the array checking key/value pairs
-        while self._buckets.get_at_index(quad_index) is not None:
-            curr = self._buckets.get_at_index(quad_index)
+        :param key: a Python string instance.
 
-            # Returns value if key matches and is not a tombstone
-            if curr.key == key and not curr.is_tombstone:
-                return curr.value
+        :return: a Boolean (True if the key is in the Hashmap object, False otherwise).
+        """
+        return self._locate(key, self._hash_function(key))[4] >= 0
 
-            # Recalculates new quad index using quadratic probing formula
-            quad_index = (hash_index + prob_index ** 2) % self._capacity
-            prob_index += 1
+    def remove(self, key: str) -> None:
+        """
+        Removes the key passed as parameter and its associated value from the Hashmap object.
 
-        return None
+        :param key: a Python string instance.
 
-    def contains_key(self, key: str) -> bool:
+        :return: does not return
         """
-        Checks if a key passed as a parameter exists in a Hashmap object
+        self._remove_hashed(key, self._hash_function(key))
 
-        :param key: a Python string instance.
+    def _remove_hashed(self, key: str, hash: int) -> None:
+        """
+        Helper method which removes a key given its hash.
 
-        :return: a Boolean (True if the key is in the Hashmap object, False otherwise).
+        :param key: a Python string instance
+        :param hash: an integer (hash of key)
+
+        :return: does not return
         """
-        # Applies hash function to capacity to get hash index
-        hash_index = self._hash_function(key) % self.get_capacity()
+        _, keys, values, states, index = self._locate(key, hash)
+        if index < 0:
+            return
 
-        # Start quadratic probing
-        quad_index = hash_index
-        prob_index = 1
+        self._size -= 1
 
-        # Traverses the array checking key/value pairs
-        while self._buckets.get_at_index(quad_index) is not None:
-            curr = self._buckets.get_at_index(quad_index)
+        # Robin Hood tables shift the following entries back instead
+        if self._probing == 'robin_hood' and states is self._states:
+            self._backward_shift(index)
+            return
 
-            # Returns True if key matches and is not a tombstone
-            if curr.key == key and not curr.is_tombstone:
-                return True
+        # Replaces the key/value pair with a tombstone, releasing both objects
+        states[index] = _TOMBSTONE
+        keys[index] = None
+        values[index] = None
 
-            # Recalculates new quad index using quadratic probing formula
-            quad_index = (hash_index + prob_index ** 2) % self._capacity
-            prob_index += 1
+        # Tombstones of the old table disappear with it once migrated
+        if states is self._states:
+            self._tombstones += 1
+            if (self._tombstone_limit is not None
+                    and self._tombstones > self._tombstone_limit * self._capacity):
+                self.compact()
 
-        return False
+    def put_many(self, pairs) -> None:
+        """
+        Updates many key/value pairs, resizing at most once (up front, from
+        the batch length) instead of whenever the maximum load is reached.
 
-    def remove(self, key: str) -> None:
+        :param pairs: a DynamicArray or iterable of (key, value) tuples
+
+        :return: does not return
         """
-        Removes the key passed as parameter and its associated value from the Hashmap object.
+        pairs = as_list(pairs)
 
-        :param key: a Python string instance.
+        # Pre-sizes for the whole batch (as if every key were new)
+        needed = self._size + len(pairs)
+        if needed >= self._max_load * self._capacity:
+            self.resize_table(int(needed / self._max_load) + 1)
+
+        function = self._hash_function
+        hashes = [function(key) for key, _ in pairs]
+        for (key, value), hash in zip(pairs, hashes):
+            self._put_hashed(key, hash, value)
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Finds the values associated to many keys.
+
+        :param keys: a DynamicArray or iterable of Python string instances
+
+        :return: DynamicArray of values, in the order of keys (None if absent)
+        """
+        keys = as_list(keys)
+        function = self._hash_function
+        hashes = [function(key) for key in keys]
+
+        final_array = DynamicArray()
+        for key, hash in zip(keys, hashes):
+            _, _, values, _, index = self._locate(key, hash)
+            final_array.append(values[index] if index >= 0 else None)
+
+        return final_array
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes many keys and their associated values.
+
+        :param keys: a DynamicArray or iterable of Python string instances
 
         :return: does not return
         """
-        # Applies hash function to capacity to get hash index
-        hash_index = self._hash_function(key) % self.get_capacity()
+        keys = as_list(keys)
+        function = self._hash_function
+        hashes = [function(key) for key in keys]
+        for key, hash in zip(keys, hashes):
+            self._remove_hashed(key, hash)
 
-        # Start quadratic probing
-        quad_index = hash_index
-        prob_index = 1
+    def tombstone_count(self) -> int:
+        """
+        Returns the number of tombstones (removed entries still in the
+        probe sequences) in the table.
 
-        # Traverses the array looking for key/value pair to remove
-        while self._buckets.get_at_index(quad_index) is not None:
-            curr = self._buckets.get_at_index(quad_index)
+        :param: a Hashmap object
 
-            # Removes the key/pair value and replaces with a tombstone
-            if curr.key == key and not curr.is_tombstone:
-                curr.is_tombstone = True
-                self._size -= 1
-                return
+        :return: an integer
+        """
+        self._finish_migration()
+        return self._tombstones
+
+    def compact(self) -> None:
+        """
+        Rehashes the entries in place, without changing the capacity,
+        dropping every tombstone so probe sequences are as short as
+        right after a resize.
+
+        :param: a Hashmap object
 
-            # Recalculates new quad index using quadratic probing formula
-            quad_index = (hash_index + prob_index ** 2) % self._capacity
-            prob_index += 1
+        :return: does not return
+        """
+        self._finish_migration()
+        if self._tombstones == 0:
+            return
+
+        states, hashes = self._states, self._hashes
+        keys, values = self._keys, self._values
+        capacity = self._capacity
+
+        # Live entries are pending placement, tombstones become empty slots
+        for index in range(capacity):
+            states[index] = _PENDING if states[index] == _FULL else _EMPTY
+
+        # Each pending entry moves to the first empty or pending slot of its
+        # probe sequence; a pending entry found there is swapped out and
+        # placed next, so no extra table is needed
+        for index in range(capacity):
+            while states[index] == _PENDING:
+                target, step, step_inc = _probe_start(hashes[index], capacity, self._probing)
+                while states[target] == _FULL:
+                    target = (target + step) % capacity
+                    step += step_inc
+
+                if target == index:
+                    states[index] = _FULL
+                    continue
+
+                hashes[index], hashes[target] = hashes[target], hashes[index]
+                keys[index], keys[target] = keys[target], keys[index]
+                values[index], values[target] = values[target], values[index]
+                if states[target] == _EMPTY:
+                    states[index] = _EMPTY
+                states[target] = _FULL
+
+        self._tombstones = 0
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -285,12 +744,12 @@ class HashMap:
         :return: DynamicArrays instances containing tuples of keys/values
         """
         final_array = DynamicArray()
+        self._finish_migration()
 
         # Traverses array, takes key/value pair from position and append to final array.
-        for index in range(self._buckets.length()):
-            curr = self._buckets.get_at_index(index)
-            if curr is not None and not curr.is_tombstone:
-                final_array.append((curr.key, curr.value))
+        for index in range(self._capacity):
+            if self._states[index] == _FULL:
+                final_array.append((self._keys[index], self._values[index]))
 
         return final_array
 
@@ -302,11 +761,9 @@ class HashMap:
 
         :return: does not return
         """
-
-        self._buckets = DynamicArray()
-        for _ in range(self._capacity):
-            self._buckets.append(None)
+        self._allocate(self._capacity)
         self._size = 0
+        self._old = None
 
     def __iter__(self):
         """
@@ -316,15 +773,8 @@ class HashMap:
 
         :return: an iterator
         """
+        self._finish_migration()
         self._current = 0
-
-        # Finds the first non-tombstone entry to start iteration
-        while self._current < self.get_capacity():
-            entry = self._buckets.get_at_index(self._current)
-            if entry is not None and not entry.is_tombstone:
-                break
-            self._current += 1
-
         return self
 
     def __next__(self):
@@ -333,14 +783,14 @@ class HashMap:
 
         :param: a Hashmap object
 
-        :return: the next key/value pair in the hash map
+        :return: the next key/value pair in the hash map (as a HashEntry)
         """
 
         while self._current < self.get_capacity():
-            entry = self._buckets.get_at_index(self._current)
+            index = self._current
             self._current += 1
-            if entry is not None and not entry.is_tombstone:
-                return entry
+            if self._states[index] == _FULL:
+                return self._entry_at(index)
 
         raise StopIteration
 
@@ -553,3 +1003,67 @@ if __name__ == "__main__":
     print(m)
     for item in m:
         print('K:', item.key, 'V:', item.value)
+
+    print("\nincremental resize example 1")
+    print("---------------------")
+    m = HashMap(11, hash_function_2, incremental=True)
+    for i in range(40):
+        m.put(str(i), i)
+        if m.is_resizing():
+            print(i, m.get_size(), m.get_capacity(), m.get(str(i // 2)))
+    print(m.get_size(), m.get_capacity(), m.is_resizing())
+
+    print("\nprobing strategies example 1")
+    print("---------------------")
+    for probing in PROBING_LOADS:
+        m = HashMap(11, hash_function_2, probing=probing)
+        for i in range(200):
+            m.put('str' + str(i), i)
+        for i in range(0, 200, 2):
+            m.remove('str' + str(i))
+        print(probing, m.get_size(), m.get_capacity(), m.empty_buckets(),
+              m.get('str99'), m.contains_key('str98'))
+
+    print("\ncompact example 1")
+    print("---------------------")
+    m = HashMap(53, hash_function_1, tombstone_limit=None)
+    for i in range(20):
+        m.put('key' + str(i), i)
+    for i in range(0, 20, 2):
+        m.remove('key' + str(i))
+    print(m.get_size(), m.get_capacity(), m.tombstone_count())
+    m.compact()
+    print(m.get_size(), m.get_capacity(), m.tombstone_count(), m.get('key19'))
+
+    print("\ncompact example 2")
+    print("---------------------")
+    m = HashMap(53, hash_function_2)
+    for i in range(2000):
+        m.put('key' + str(i % 20), i)
+        m.remove('key' + str((i + 10) % 20))
+    print(m.get_size(), m.get_capacity(), m.tombstone_count())
+
+    print("\nput_many / get_many / remove_many example 1")
+    print("---------------------")
+    m = HashMap(11, hash_function_1)
+    m.put_many(DynamicArray([('key' + str(i), i) for i in range(100)]))
+    print(m.get_size(), m.get_capacity())
+    print(m.get_many(['key1', 'key50', 'missing', 'key99']))
+    m.remove_many(DynamicArray(['key' + str(i) for i in range(0, 100, 2)]))
+    print(m.get_size(), m.get_many(['key1', 'key2']))
+
+    print("\nwith_expected_size example 1")
+    print("---------------------")
+    m = HashMap.with_expected_size(1000, hash_function_2)
+    capacity = m.get_capacity()
+    for i in range(1000):
+        m.put('key' + str(i), i)
+    print(capacity, m.get_size(), m.get_capacity(), round(m.table_load(), 2))
+
+    print("\npower-of-two capacity example 1")
+    print("---------------------")
+    from a6_include import xxhash64
+    m = HashMap(10, xxhash64, power_of_two=True)
+    for i in range(100):
+        m.put('key' + str(i), i)
+    print(m.get_size(), m.get_capacity(), m.get('key42'), m.contains_key('key100'))
@@ -0,0 +1,439 @@
+# Course: CS261 - Data Structures
+# Description: HashMap using open addressing with Swiss-table style metadata.
+#              Every slot has a one-byte control tag in a bytearray: 7 bits
+#              of the key's hash for a full slot, or an empty / deleted
+#              marker. Lookups scan the tags of a group of 16 slots at a time
+#              (with bytearray.find, in C) and only read the key array when
+#              a tag matches, which happens for 1 in 128 other keys.
+#              Hashes are spread over 64 bits first, so weak functions such
+#              as hash_function_1 still give varied tags and groups.
+
+from a6_include import DynamicArray, HashEntry, hash_function_1, hash_function_2
+
+
+GROUP_SIZE = 16
+
+# Control tags: 0-127 is the top 7 bits of a full slot's (spread) hash,
+# the high bit marks a slot without an entry
+_EMPTY = 0x80
+_DELETED = 0xFE
+
+_EMPTY_TAG = bytes((_EMPTY,))
+_DELETED_TAG = bytes((_DELETED,))
+_FULL_TAGS = [bytes((tag,)) for tag in range(128)]
+
+_MASK_64 = (1 << 64) - 1
+_MASK_GROUP = (1 << 57) - 1     # hash bits below the tag
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def _spread(hash: int) -> int:
+    """
+    Helper function which spreads a hash over 64 bits (Fibonacci hashing);
+    its top 7 bits give the tag and the rest choose the group.
+
+    :param hash: an integer
+
+    :return: an integer
+    """
+    return ((hash ^ (hash >> 32)) * _GOLDEN) & _MASK_64
+
+
+class HashMap:
+    def __init__(self, capacity: int, function, max_load: float = 0.875) -> None:
+        """
+        Initialize new HashMap that uses open addressing over groups of
+        GROUP_SIZE slots for collision resolution. Capacity is rounded up
+        to whole groups; the table is resized once full and deleted slots
+        reach max_load of it
+        """
+        self._hash_function = function
+        self._max_load = max_load
+
+        self._capacity = self._round_capacity(capacity)
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            out += str(i) + ': ' + str(self._entry_at(i)) + '\n'
+        return out
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """
+        Round capacity up to a whole number of groups (at least one)
+        """
+        groups = max(1, -(-capacity // GROUP_SIZE))
+        return groups * GROUP_SIZE
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Helper method which allocates empty parallel arrays for the table:
+        control tags, cached (spread) hashes, keys and values.
+
+        :param capacity: an integer
+
+        :return: does not return
+        """
+        self._ctrl = bytearray(_EMPTY_TAG * capacity)
+        self._hashes = [0] * capacity
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+        self._groups = capacity // GROUP_SIZE
+        self._deleted = 0
+
+    def _entry_at(self, index: int) -> HashEntry:
+        """
+        Helper method which builds a HashEntry view of a slot
+        (None for an empty slot).
+
+        :param index: an integer
+
+        :return: a HashEntry object or None
+        """
+        tag = self._ctrl[index]
+        if tag == _EMPTY:
+            return None
+
+        entry = HashEntry(self._keys[index], self._values[index], self._hashes[index])
+        entry.is_tombstone = tag == _DELETED
+        return entry
+
+    def _find_index(self, key: str, hash: int) -> int:
+        """
+        Helper method which scans the groups of the probe sequence of key
+        for slots tagged with its hash, comparing keys only on a tag match.
+        The first group with an empty slot ends the search.
+
+        :param key: a Python string instance
+        :param hash: an integer (spread hash of key)
+
+        :return: an integer (slot index of key, or -1 if absent)
+        """
+        ctrl, keys = self._ctrl, self._keys
+        tag = _FULL_TAGS[hash >> 57]
+        group = (hash & _MASK_GROUP) % self._groups
+
+        for _ in range(self._groups):
+            start = group * GROUP_SIZE
+            end = start + GROUP_SIZE
+
+            index = ctrl.find(tag, start, end)
+            while index >= 0:
+                if keys[index] == key:
+                    return index
+                index = ctrl.find(tag, index + 1, end)
+
+            if ctrl.find(_EMPTY_TAG, start, end) >= 0:
+                return -1
+            group = (group + 1) % self._groups
+
+        return -1
+
+    def _free_index(self, hash: int) -> int:
+        """
+        Helper method which finds the first empty or deleted slot in the
+        groups of the probe sequence of hash.
+
+        :param hash: an integer (spread hash of a key)
+
+        :return: an integer (slot index)
+        """
+        ctrl = self._ctrl
+        group = (hash & _MASK_GROUP) % self._groups
+
+        while True:
+            start = group * GROUP_SIZE
+            end = start + GROUP_SIZE
+
+            empty = ctrl.find(_EMPTY_TAG, start, end)
+            deleted = ctrl.find(_DELETED_TAG, start, end)
+            if empty >= 0 or deleted >= 0:
+                return empty if deleted < 0 or 0 <= empty < deleted else deleted
+            group = (group + 1) % self._groups
+
+    def _insert_new(self, key: str, hash: int, value: object) -> None:
+        """
+        Helper method which stores a key known to be absent in the first
+        free slot of its probe sequence; does not change the size.
+
+        :param key: a Python string instance
+        :param hash: an integer (spread hash of key)
+        :param value: any Python object
+
+        :return: does not return
+        """
+        index = self._free_index(hash)
+        if self._ctrl[index] == _DELETED:
+            self._deleted -= 1
+
+        self._ctrl[index] = hash >> 57
+        self._hashes[index] = hash
+        self._keys[index] = key
+        self._values[index] = value
+
+    def _probe_count(self, key: str) -> int:
+        """
+        Helper method which counts the groups a lookup of key scans
+        (used by hash_analysis).
+
+        :param key: a Python string instance
+
+        :return: an integer
+        """
+        hash = _spread(self._hash_function(key))
+        ctrl, keys = self._ctrl, self._keys
+        tag = _FULL_TAGS[hash >> 57]
+        group = (hash & _MASK_GROUP) % self._groups
+        count = 1
+
+        while count < self._groups:
+            start = group * GROUP_SIZE
+            end = start + GROUP_SIZE
+
+            index = ctrl.find(tag, start, end)
+            while index >= 0:
+                if keys[index] == key:
+                    return count
+                index = ctrl.find(tag, index + 1, end)
+
+            if ctrl.find(_EMPTY_TAG, start, end) >= 0:
+                return count
+            group = (group + 1) % self._groups
+            count += 1
+
+        return count
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in a Hashmap object.
+
+        :param key: a Python string instance.
+        :param value: any Python object
+
+        :return: does not return
+        """
+        hash = _spread(self._hash_function(key))
+
+        # Replaces value if key matches
+        index = self._find_index(key, hash)
+        if index >= 0:
+            self._values[index] = value
+            return
+
+        # Full and deleted slots both lengthen probes: rehashes in place if
+        # deleted slots are to blame, otherwise doubles the capacity
+        if (self._size + self._deleted + 1) > self._max_load * self._capacity:
+            if self._size + 1 <= self._max_load * self._capacity / 2:
+                self.resize_table(self._capacity)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        self._insert_new(key, hash, value)
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resizes the hash map to a new capacity (rounded up to whole groups)
+        and rehashes all key/value pairs, reusing their cached hashes.
+
+        :param new_capacity: an integer
+
+        :return: does not return
+        """
+        # Checks if the new capacity can hold the items
+        if new_capacity < self.get_size():
+            return
+
+        ctrl, hashes = self._ctrl, self._hashes
+        keys, values = self._keys, self._values
+        self._capacity = self._round_capacity(new_capacity)
+        self._allocate(self._capacity)
+
+        for index in range(len(ctrl)):
+            if ctrl[index] < _EMPTY:
+                self._insert_new(keys[index], hashes[index], values[index])
+
+    def table_load(self) -> float:
+        """
+        Calculates and returns the current hash table load factor.
+
+        :param: a Hashmap object
+
+        :return: a float
+        """
+        return self.get_size() / self.get_capacity()
+
+    def empty_buckets(self) -> int:
+        """
+        Checks and returns the number of empty buckets in a HashMap instance.
+
+        :param: a Hashmap object
+
+        :return: an integer
+        """
+        return self._capacity - self._size
+
+    def get(self, key: str) -> object:
+        """
+        Finds the value associated to a key in a Hashmap object.
+
+        :param key: a Python string instance
+
+        :return: any Python object
+        """
+        index = self._find_index(key, _spread(self._hash_function(key)))
+        return self._values[index] if index >= 0 else None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Checks if a key passed as a parameter exists in a Hashmap object
+
+        :param key: a Python string instance.
+
+        :return: a Boolean (True if the key is in the Hashmap object, False otherwise).
+        """
+        return self._find_index(key, _spread(self._hash_function(key))) >= 0
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the key passed as parameter and its associated value from the Hashmap object.
+
+        :param key: a Python string instance.
+
+        :return: does not return
+        """
+        index = self._find_index(key, _spread(self._hash_function(key)))
+        if index < 0:
+            return
+
+        # A group which still has an empty slot never sent a probe on to the
+        # next group, so the slot can become empty again; otherwise probes
+        # must keep going through it
+        start = index - index % GROUP_SIZE
+        if self._ctrl.find(_EMPTY_TAG, start, start + GROUP_SIZE) >= 0:
+            self._ctrl[index] = _EMPTY
+        else:
+            self._ctrl[index] = _DELETED
+            self._deleted += 1
+
+        self._keys[index] = None
+        self._values[index] = None
+        self._size -= 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Traverses a Hashmap object and retrieves keys/values tuples stored in it.
+
+        :param: a Hashmap object.
+
+        :return: DynamicArrays instances containing tuples of keys/values
+        """
+        final_array = DynamicArray()
+        for index in range(self._capacity):
+            if self._ctrl[index] < _EMPTY:
+                final_array.append((self._keys[index], self._values[index]))
+
+        return final_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of a Hashmap object without changing its capacity.
+
+        :param key: a Hashmap object
+
+        :return: does not return
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+
+    def __iter__(self):
+        """
+        Returns an iterator for the hash map.
+
+        :param: a Hashmap object
+
+        :return: an iterator
+        """
+        self._current = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map.
+
+        :param: a Hashmap object
+
+        :return: the next key/value pair in the hash map (as a HashEntry)
+        """
+        while self._current < self._capacity:
+            index = self._current
+            self._current += 1
+            if self._ctrl[index] < _EMPTY:
+                return self._entry_at(index)
+
+        raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get example 1")
+    print("---------------------")
+    m = HashMap(20, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.get_size(), m.get_capacity(), round(m.table_load(), 2),
+                  m.empty_buckets(), m.get('str' + str(i // 2)))
+
+    print("\nremove example 1")
+    print("---------------------")
+    m = HashMap(16, hash_function_2)
+    for i in range(12):
+        m.put('key' + str(i), i)
+    m.remove('key1')
+    m.remove('key5')
+    m.remove('missing')
+    print(m.get_size(), m.get_capacity(), m.contains_key('key1'), m.get('key11'))
+    print(m)
+
+    print("\nchurn example 1")
+    print("---------------------")
+    m = HashMap(64, hash_function_2)
+    for i in range(5000):
+        m.put('key' + str(i), i)
+        m.remove('key' + str(i - 40))
+    print(m.get_size(), m.get_capacity(), m._deleted)
+
+    print("\nget_keys_and_values example 1")
+    print("---------------------")
+    m = HashMap(11, hash_function_1)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    print(m.get_keys_and_values())
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
+    m.clear()
+    print(m.get_size(), m.get_capacity())
@@ -0,0 +1,185 @@
+# Course: CS261 - Data Structures
+# Description: Hash functions for the HashMaps (SC & OA). Unlike the sample
+#              hash functions in a6_include, these work on the encoded bytes
+#              of the key, spread similar keys (e.g. anagrams) over the whole
+#              64-bit range. All of them return non-negative integers, so
+#              they can be used with % capacity or with a bit mask.
+#              Speed: builtin_hash, crc_hash and keyed_hash run in C and are
+#              the cheap choices for long keys; fnv1a_hash (and xxhash64
+#              without the xxhash package) are pure Python loops, slower than
+#              the sample functions, and trade that speed for distribution.
+
+
+import hashlib
+import struct
+import zlib
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+_MASK_64 = (1 << 64) - 1
+
+# FNV-1a 64-bit parameters
+_FNV_OFFSET = 0xcbf29ce484222325
+_FNV_PRIME = 0x100000001b3
+
+# XXH64 primes
+_P1 = 0x9E3779B185EBCA87
+_P2 = 0xC2B2AE3D27D4EB4F
+_P3 = 0x165667B19E3779F9
+_P4 = 0x85EBCA77C2B2AE63
+_P5 = 0x27D4EB2F165667C5
+
+# Fixed key for keyed_hash, so results are stable across runs
+_DEFAULT_SECRET = b"CS261-hash-map-k"
+
+
+def _to_bytes(key) -> bytes:
+    """Helper function which encodes a key (str or bytes) as bytes."""
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    return str(key).encode("utf-8", "surrogatepass")
+
+
+def _rotl(value: int, bits: int) -> int:
+    """Helper function which rotates a 64-bit integer left by bits."""
+    return ((value << bits) | (value >> (64 - bits))) & _MASK_64
+
+
+def fnv1a_hash(key: str) -> int:
+    """
+    64-bit FNV-1a hash of the UTF-8 bytes of key.
+    Simple and well distributed, but a pure Python loop over one byte
+    per step, slower than the sample hash functions; it trades speed
+    for distribution, so prefer crc_hash or keyed_hash for long keys.
+    """
+    hash = _FNV_OFFSET
+    for byte in _to_bytes(key):
+        hash = ((hash ^ byte) * _FNV_PRIME) & _MASK_64
+    return hash
+
+
+def _xxh64_round(acc: int, lane: int) -> int:
+    """Helper function: one XXH64 accumulator round."""
+    acc = (acc + lane * _P2) & _MASK_64
+    return (_rotl(acc, 31) * _P1) & _MASK_64
+
+
+def _xxh64_merge(acc: int, value: int) -> int:
+    """Helper function: merge one XXH64 accumulator into the hash."""
+    acc ^= _xxh64_round(0, value)
+    return (acc * _P1 + _P4) & _MASK_64
+
+
+def xxhash64(key: str, seed: int = 0) -> int:
+    """
+    XXH64 hash of the UTF-8 bytes of key. Uses the xxhash package when
+    installed, which returns the same values at C speed. Otherwise it
+    falls back to pure Python (32 bytes per step), which trades speed
+    for distribution and is slower than crc_hash or keyed_hash.
+    """
+    data = _to_bytes(key)
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data, seed)
+
+    length = len(data)
+    offset = length - length % 32
+
+    if length >= 32:
+        v1 = (seed + _P1 + _P2) & _MASK_64
+        v2 = (seed + _P2) & _MASK_64
+        v3 = seed & _MASK_64
+        v4 = (seed - _P1) & _MASK_64
+        for lane1, lane2, lane3, lane4 in struct.iter_unpack("<4Q", data[:offset]):
+            v1 = _xxh64_round(v1, lane1)
+            v2 = _xxh64_round(v2, lane2)
+            v3 = _xxh64_round(v3, lane3)
+            v4 = _xxh64_round(v4, lane4)
+        hash = (_rotl(v1, 1) + _rotl(v2, 7) + _rotl(v3, 12) + _rotl(v4, 18)) & _MASK_64
+        for acc in (v1, v2, v3, v4):
+            hash = _xxh64_merge(hash, acc)
+    else:
+        hash = (seed + _P5) & _MASK_64
+
+    hash = (hash + length) & _MASK_64
+
+    # Remaining 8-byte words, 4-byte word and single bytes
+    while offset + 8 <= length:
+        lane, = struct.unpack_from("<Q", data, offset)
+        hash ^= _xxh64_round(0, lane)
+        hash = (_rotl(hash, 27) * _P1 + _P4) & _MASK_64
+        offset += 8
+
+    if offset + 4 <= length:
+        lane, = struct.unpack_from("<I", data, offset)
+        hash ^= (lane * _P1) & _MASK_64
+        hash = (_rotl(hash, 23) * _P2 + _P3) & _MASK_64
+        offset += 4
+
+    for byte in data[offset:]:
+        hash ^= (byte * _P5) & _MASK_64
+        hash = (_rotl(hash, 11) * _P1) & _MASK_64
+
+    # Final avalanche
+    hash ^= hash >> 33
+    hash = (hash * _P2) & _MASK_64
+    hash ^= hash >> 29
+    hash = (hash * _P3) & _MASK_64
+    hash ^= hash >> 32
+    return hash
+
+
+def crc_hash(key: str) -> int:
+    """
+    CRC-32 of the UTF-8 bytes of key (zlib, in C), spread over 64 bits
+    by a multiplicative finalizer. Stable across runs and cheap on long
+    keys, but only 2**32 distinct values and easy to collide on purpose;
+    use keyed_hash for untrusted keys.
+    """
+    return (zlib.crc32(_to_bytes(key)) * _P1) & _MASK_64
+
+
+def keyed_hash(key: str, secret: bytes = _DEFAULT_SECRET) -> int:
+    """
+    SipHash-style keyed 64-bit hash: a keyed pseudo-random function over
+    the UTF-8 bytes of key (BLAKE2b in C from hashlib), so collisions
+    cannot be crafted without knowing the secret (up to 64 bytes).
+    """
+    digest = hashlib.blake2b(_to_bytes(key), digest_size=8, key=secret).digest()
+    return int.from_bytes(digest, "little")
+
+
+def builtin_hash(key: str) -> int:
+    """
+    Adapter around the builtin hash(), which for str and bytes is
+    SipHash computed in C. Values are only stable within one process
+    (see PYTHONHASHSEED), so don't store them.
+    """
+    return hash(key) & _MASK_64
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    from a6_include import hash_function_1, hash_function_2
+
+    print("\n# reference values")
+    print(hex(fnv1a_hash("")), hex(fnv1a_hash("a")))
+    print(hex(xxhash64("")), hex(xxhash64("a")), hex(xxhash64("x" * 100)))
+    print(hex(crc_hash("")), hex(crc_hash("a")))
+
+    print("\n# anagrams")
+    for function in (hash_function_1, hash_function_2, fnv1a_hash,
+                     xxhash64, crc_hash, keyed_hash):
+        print(function.__name__, [function(key) % 101 for key in ("listen", "silent", "enlist")])
+
+    print("\n# distinct buckets for 1000 short keys in 1009 buckets")
+    for function in (hash_function_1, hash_function_2, fnv1a_hash,
+                     xxhash64, crc_hash, keyed_hash):
+        buckets = set(function("key" + str(i)) % 1009 for i in range(1000))
+        print(function.__name__, len(buckets))
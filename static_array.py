@@ -5,6 +5,9 @@
 #               at the bottom for some tips on how to use the StaticArray.
 
 
+from array import array
+
+
 class StaticArrayException(Exception):
     """
     Custom exception for Static Array class.
@@ -16,7 +19,13 @@ class StaticArrayException(Exception):
 class StaticArray:
     """
     Implementation of Static Array Data Structure.
-    Implemented methods: get(), set(), length()
+    Implemented methods: get(), set(), length(), typecode(),
+    get_memoryview(), copy_range(), move_range(), fill_range(),
+    set_range()
+
+    An optional typecode (any code accepted by the array module, such as
+    'i', 'q' or 'd') stores the elements unboxed in a compact array.array
+    instead of a list of Python objects.
 
     Any changes to this class are forbidden.
 
@@ -26,12 +35,13 @@ class StaticArray:
     a StaticArray file is ignored.
     """
 
-    def __init__(self, size: int = 10) -> None:
+    def __init__(self, size: int = 10, typecode: str = None) -> None:
         """
         Create array of given size.
-        Initialize all elements with values of None.
-        If requested size is not a positive number,
-        raise StaticArray Exception.
+        Initialize all elements with values of None (or zero when a
+        typecode is given).
+        If requested size is not a positive number or the typecode is
+        not valid, raise StaticArray Exception.
         """
         if size < 1:
             raise StaticArrayException('Array size must be a positive integer')
@@ -41,10 +51,20 @@ class StaticArray:
         # Use the length() method to get the size of a StaticArray.
         self._size = size
 
-        # Remember, this is a built-in list and is used here
-        # because Python doesn't have a fixed-size array type.
-        # Don't initialize variables like this in your assignments!
-        self._data = [None] * size
+        self._typecode = typecode
+
+        if typecode is None:
+            # Remember, this is a built-in list and is used here
+            # because Python doesn't have a fixed-size array type.
+            # Don't initialize variables like this in your assignments!
+            self._data = [None] * size
+        else:
+            # Typed arrays hold raw machine values, so there is no None
+            # and every element starts as zero
+            try:
+                self._data = array(typecode, [0]) * size
+            except (TypeError, ValueError):
+                raise StaticArrayException('Invalid typecode')
 
     def __iter__(self) -> None:
         """
@@ -62,6 +82,8 @@ class StaticArray:
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
+        if self._typecode is not None:
+            return f"STAT_ARR Size: {self._size} {self._data.tolist()}"
         return f"STAT_ARR Size: {self._size} {self._data}"
 
     def get(self, index: int):
@@ -80,7 +102,10 @@ class StaticArray:
         """
         if index < 0 or index >= self.length():
             raise StaticArrayException('Index out of bounds')
-        self._data[index] = value
+        try:
+            self._data[index] = value
+        except (TypeError, OverflowError):
+            raise StaticArrayException('Value does not fit array typecode')
 
     def __getitem__(self, index: int):
         """Enable bracketed indexing."""
@@ -94,6 +119,85 @@ class StaticArray:
         """Return length of the array (number of elements)."""
         return self._size
 
+    def typecode(self) -> str:
+        """Return typecode of the array (None for an untyped array)."""
+        return self._typecode
+
+    def get_memoryview(self) -> memoryview:
+        """
+        Return a zero-copy memoryview over the storage of a typed array.
+        Writes through the view change the array itself.
+        Untyped arrays raise StaticArrayException.
+        """
+        if self._typecode is None:
+            raise StaticArrayException('Only typed arrays export a buffer')
+        return memoryview(self._data)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Enable memoryview(arr) and the buffer protocol (Python 3.12+)."""
+        return self.get_memoryview()
+
+    def _check_range(self, start: int, count: int) -> None:
+        """Raise StaticArrayException if [start, start + count) is invalid."""
+        if count < 0 or start < 0 or start + count > self.length():
+            raise StaticArrayException('Index out of bounds')
+
+    def copy_range(self, src: "StaticArray", src_start: int,
+                   dest_start: int, count: int) -> None:
+        """
+        Copy count elements of src, starting at src_start, into this
+        array starting at dest_start, as a single slice assignment.
+        Ranges are validated once; an invalid range raises
+        StaticArrayException. src may be this same array, and
+        overlapping ranges are handled like memmove().
+        """
+        src._check_range(src_start, count)
+        self._check_range(dest_start, count)
+
+        block = src._data[src_start:src_start + count]
+        if self._typecode is not None and src._typecode != self._typecode:
+            try:
+                block = array(self._typecode, block)
+            except (TypeError, OverflowError):
+                raise StaticArrayException('Value does not fit array typecode')
+        self._data[dest_start:dest_start + count] = block
+
+    def move_range(self, src_start: int, dest_start: int, count: int) -> None:
+        """
+        Move count elements inside this array from src_start to dest_start.
+        Overlapping ranges are handled like memmove().
+        """
+        self.copy_range(self, src_start, dest_start, count)
+
+    def set_range(self, start: int, values) -> None:
+        """
+        Store a sized sequence of values starting at start, as a single
+        slice assignment. Invalid range raises StaticArrayException.
+        """
+        count = len(values)
+        self._check_range(start, count)
+        if self._typecode is not None and not (
+                isinstance(values, array) and values.typecode == self._typecode):
+            try:
+                values = array(self._typecode, values)
+            except (TypeError, OverflowError):
+                raise StaticArrayException('Value does not fit array typecode')
+        self._data[start:start + count] = values
+
+    def fill_range(self, start: int, count: int, value: object) -> None:
+        """
+        Store value in count elements starting at start.
+        Invalid range raises StaticArrayException.
+        """
+        self._check_range(start, count)
+        if self._typecode is None:
+            self._data[start:start + count] = [value] * count
+            return
+        try:
+            self._data[start:start + count] = array(self._typecode, [value]) * count
+        except (TypeError, OverflowError):
+            raise StaticArrayException('Value does not fit array typecode')
+
 
 if __name__ == "__main__":
 
@@ -127,6 +231,22 @@ if __name__ == "__main__":
     for index in range(arr.length() - 1, -1,-1):
         print(arr[index])
 
+    # Create a typed StaticArray that stores 64-bit integers compactly
+    arr = StaticArray(5, 'q')
+    for index in range(arr.length()):
+        arr[index] = index * 10
+    print(arr, arr.typecode())
+
+    # Typed arrays can be shared without copying through a memoryview
+    view = arr.get_memoryview()
+    view[0] = 99
+    print(arr[0], view.tolist())
+
+    # Blocks of elements can be shifted or filled with a single call
+    arr.move_range(0, 1, 4)
+    arr.fill_range(0, 1, -1)
+    print(arr)
+
     # Special consideration below #
 
     # Don't do this! This creates a built-in Python list and if you use